@@ -0,0 +1,47 @@
+"""
+
+Preserve mtimes of unchanged AutoAPI-generated pages.
+
+Even with ``autoapi_keep_files = True``, AutoAPI rewrites every
+generated ``.rst`` file on each build, bumping mtimes and invalidating
+Sphinx's doctree cache for the entire API tree. This extension
+snapshots the generated tree before AutoAPI runs and restores the
+original mtime of any file whose content is byte-identical afterwards,
+so incremental builds find those pages up to date and skip them.
+
+"""
+
+import os
+from pathlib import Path
+
+from sphinx.application import Sphinx
+
+_snapshot: dict[Path, tuple[bytes, os.stat_result]] = {}
+
+
+def _autoapi_out_dir(app: Sphinx) -> Path:
+    return Path(app.srcdir) / app.config.autoapi_root
+
+
+def _snapshot_generated(app: Sphinx) -> None:
+    _snapshot.clear()
+    out_dir = _autoapi_out_dir(app)
+    if not out_dir.is_dir():
+        return
+    for _path in out_dir.rglob("*.rst"):
+        _snapshot[_path] = (_path.read_bytes(), _path.stat())
+
+
+def _restore_unchanged(app: Sphinx) -> None:
+    for _path, (_content, _stat) in _snapshot.items():
+        if _path.is_file() and _path.read_bytes() == _content:
+            os.utime(_path, ns=(_stat.st_atime_ns, _stat.st_mtime_ns))
+    _snapshot.clear()
+
+
+def setup(app: Sphinx) -> dict[str, bool]:
+    # AutoAPI generates its pages at builder-inited with default
+    # priority (500); bracket it with the snapshot and restore passes
+    app.connect("builder-inited", _snapshot_generated, priority=400)
+    app.connect("builder-inited", _restore_unchanged, priority=600)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -11,20 +11,21 @@ and extensions.
 """
 
 import sys
+import tomllib
 from pathlib import Path
-from subprocess import PIPE, run
+
+sys.path.insert(0, f"{Path(__file__).parent / '_ext'}")
 
 import pendulum
 import semver
 
-version_str = run(  # noqa: S603
-    ["poetry", "version"],  # noqa: S607
-    stdout=PIPE,
-    text=True,
-    check=True,
-).stdout.strip()
+# Read the project name and version straight from pyproject.toml; spawning
+# `poetry version` here costs a full interpreter start per Sphinx run
+_poetry_table = tomllib.loads(
+    (Path(__file__).parents[2] / "pyproject.toml").read_text()
+)["tool"]["poetry"]
 
-project_name, project_version = version_str.split()
+project_name, project_version = _poetry_table["name"], _poetry_table["version"]
 
 version_dict = semver.parse(project_version)
 
@@ -46,18 +47,18 @@ release = "{major}.{minor}.{patch}".format(**version_dict)
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    "sphinx.ext.autodoc",
-    "sphinx.ext.viewcode",
     "sphinx.ext.napoleon",
     "sphinx.ext.intersphinx",
-    "sphinx_autodoc_typehints",
     "autoapi.extension",
     "sphinx_immaterial",
+    "autoapi_write_if_changed",
 ]
 
-autodoc_typehints = "description"
-autodoc_typehints_description_target = "documented"
-
+# AutoAPI parses the package sources statically, so builds don't pay
+# the import cost of mergeron and its compiled dependencies
+autoapi_type = "python"
+autoapi_dirs = ["../../src/"]
+autoapi_python_use_implicit_namespaces = False
 autoapi_python_class_content = "class"
 autoapi_add_toctree_entry = False
 autoapi_member_order = "source"
@@ -65,7 +66,7 @@ autoapi_options = ["members", "undoc-members", "show-inheritance"]
 
 
 autoapi_template_dir = "_autoapi_templates"
-autoapi_keep_files = False
+autoapi_keep_files = True
 
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
@@ -100,11 +101,3 @@ html_static_path = ["_static"]
 html_title = f"{project} {release}"
 html_short_title = f"{project}"
 
-# -- Path setup --------------------------------------------------------------
-
-# If extensions (or modules to document with autodoc) are in another directory,
-# add these directories to sys.path here. If the directory is relative to the
-# documentation root, use os.path.abspath to make it absolute, like shown here.
-#
-sys.path.insert(0, f'{Path.resolve(Path("../../src"))}')
-autoapi_dirs = ["../../src/"]
@@ -25,8 +25,14 @@ args = parser.parse_args()
 
 tsn = pendulum.today()
 
-rc = run(["git", "status", "-uno"], check=True, stdout=PIPE, stderr=STDOUT, text=True)  # noqa: S603, S607
-if not re.search("nothing to commit", rc.stdout):
+rc = run(  # noqa: S603
+    ["git", "status", "--porcelain", "-uno"],  # noqa: S607
+    check=True,
+    stdout=PIPE,
+    stderr=STDOUT,
+    text=True,
+)
+if rc.stdout.strip():
     raise RuntimeError(
         "Repository has uncommitted changes. Commit changes before updating package version."
     )
@@ -83,15 +89,16 @@ pkg_init_path.write_text(
     )
 )
 
+# Batch the commit and tag into one spawned process; arguments are passed
+# positionally so nothing user-controlled is interpolated into the script
 run(  # noqa: S603
     [  # noqa: S607
-        "git",
-        "commit",
-        "pyproject.toml",
+        "sh",
+        "-c",
+        'git commit pyproject.toml "$1" -m "chore: update version" && git tag "$2"',
+        "sh",
         f"{pkg_init_path}",
-        "-m",
-        '"chore: update version"',
+        f"{sem_ver}",
     ],
     check=True,
 )
-run(["git", "tag", f"{sem_ver}"], check=True)  # noqa: S603, S607
@@ -35,6 +35,8 @@ price-cost margins fall in the interval :math:`[0, 1]`.
 
 import shutil
 from collections.abc import Mapping
+from email.utils import formatdate
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 from types import MappingProxyType
@@ -43,19 +45,33 @@ import msgpack  # type:ignore
 import numpy as np
 import urllib3
 from numpy.random import PCG64DXSM, Generator, SeedSequence
-from scipy import stats  # type: ignore
-from xlrd import open_workbook  # type: ignore
 
-from .. import _PKG_NAME, DATA_DIR, VERSION, ArrayDouble  # noqa: TID252
+from .. import _PKG_NAME, DATA_DIR, VERSION, ArrayBIGINT, ArrayDouble  # noqa: TID252
 
 __version__ = VERSION
 
 MGNDATA_ARCHIVE_PATH = DATA_DIR / "damodaran_margin_data_dict.msgpack"
 
+# Margins in finance, investment, insurance, reinsurance, and REITs are
+# excluded from the sample used to estimate the empirical distribution
+_SKIP_INDUSTRIES = frozenset({
+    "Bank (Money Center)",
+    "Banks (Regional)",
+    "Brokerage & Investment Banking",
+    "Financial Svcs. (Non-bank & Insurance)",
+    "Insurance (General)",
+    "Insurance (Life)",
+    "Insurance (Prop/Cas.)",
+    "Investments & Asset Management",
+    "R.E.I.T.",
+    "Retail (REITs)",
+    "Reinsurance",
+})
+
 u3pm = urllib3.PoolManager()
 
 
-def mgn_data_getter(  # noqa: PLR0912
+def mgn_data_getter(
     _table_name: str = "margin",
     *,
     data_archive_path: Path | None = None,
@@ -72,24 +88,33 @@ def mgn_data_getter(  # noqa: PLR0912
     _mgn_path = _data_archive_path.parent / f"damodaran_{_table_name}_data.xls"
     if _data_archive_path.is_file() and not data_download_flag:
         return MappingProxyType(msgpack.unpackb(_data_archive_path.read_bytes()))
-    elif _mgn_path.is_file():
-        _mgn_path.unlink()
-        if _data_archive_path.is_file():
-            _data_archive_path.unlink()
+    elif _data_archive_path.is_file():
+        _data_archive_path.unlink()
+
+    # Keep any local workbook and offer its mtime for a conditional GET;
+    # the server answers 304 with no body when the file is unchanged
+    _dl_headers = (
+        {"If-Modified-Since": formatdate(_mgn_path.stat().st_mtime, usegmt=True)}
+        if _mgn_path.is_file()
+        else {}
+    )
 
     try:
         _chunk_size = 1024 * 1024
-        with (
-            u3pm.request("GET", _mgn_urlstr, preload_content=False) as _urlopen_handle,
-            _mgn_path.open("wb") as _mgn_file,
-        ):
-            while True:
-                _data = _urlopen_handle.read(_chunk_size)
-                if not _data:
-                    break
-                _mgn_file.write(_data)
-
-        print(f"Downloaded {_mgn_urlstr} to {_mgn_path}.")
+        with u3pm.request(
+            "GET", _mgn_urlstr, headers=_dl_headers, preload_content=False
+        ) as _urlopen_handle:
+            if _urlopen_handle.status == 304:
+                print(f"Local copy of {_mgn_urlstr} is current; skipped download.")
+            else:
+                with _mgn_path.open("wb") as _mgn_file:
+                    while True:
+                        _data = _urlopen_handle.read(_chunk_size)
+                        if not _data:
+                            break
+                        _mgn_file.write(_data)
+
+                print(f"Downloaded {_mgn_urlstr} to {_mgn_path}.")
 
     except urllib3.exceptions.MaxRetryError as _err:
         if isinstance(_err.__cause__, urllib3.exceptions.SSLError):
@@ -110,26 +135,27 @@ def mgn_data_getter(  # noqa: PLR0912
         else:
             raise _err
 
+    # Deferred import: callers that hit the archived dict never pay for xlrd
+    from xlrd import open_workbook  # type: ignore
+
     _xl_book = open_workbook(_mgn_path, ragged_rows=True, on_demand=True)
     _xl_sheet = _xl_book.sheet_by_name("Industry Averages")
 
-    _mgn_dict: dict[str, dict[str, float]] = {}
-    _mgn_row_keys: list[str] = []
-    _read_row_flag = False
-    for _ridx in range(_xl_sheet.nrows):
-        _xl_row = _xl_sheet.row_values(_ridx)
-        if _xl_row[0] == "Industry Name":
-            _read_row_flag = True
-            _mgn_row_keys = _xl_row
-            continue
-
-        if not _xl_row[0] or not _read_row_flag:
-            continue
-
-        _xl_row[1] = int(_xl_row[1])
-        _mgn_dict[_xl_row[0]] = dict(zip(_mgn_row_keys[1:], _xl_row[1:], strict=True))
+    # Pull all rows in one pass, then locate the header row and parse the
+    # data rows below it, rather than branching row-by-row
+    _xl_rows = [_xl_sheet.row_values(_ridx) for _ridx in range(_xl_sheet.nrows)]
+    _hdr_idx = next(
+        _i for _i, _r in enumerate(_xl_rows) if _r[0] == "Industry Name"
+    )
+    _mgn_row_keys: list[str] = _xl_rows[_hdr_idx]
+    _mgn_dict: dict[str, dict[str, float]] = {
+        _r[0]: dict(zip(_mgn_row_keys[1:], [int(_r[1]), *_r[2:]], strict=True))
+        for _r in _xl_rows[_hdr_idx + 1 :]
+        if _r[0]
+    }
 
-    _ = _data_archive_path.write_bytes(msgpack.packb(_mgn_dict))
+    with _data_archive_path.open("wb") as _archive_fh:
+        msgpack.pack(_mgn_dict, _archive_fh)
 
     return MappingProxyType(_mgn_dict)
 
@@ -140,33 +166,15 @@ def mgn_data_builder(
     if _mgn_tbl_dict is None:
         _mgn_tbl_dict = mgn_data_getter()
 
-    _mgn_data_wts, _mgn_data_obs = (
-        _f.flatten()
-        for _f in np.hsplit(
-            np.array([
-                tuple(
-                    _mgn_tbl_dict[_g][_h] for _h in ["Number of firms", "Gross Margin"]
-                )
-                for _g in _mgn_tbl_dict
-                if not _g.startswith("Total Market")
-                and _g
-                not in (
-                    "Bank (Money Center)",
-                    "Banks (Regional)",
-                    "Brokerage & Investment Banking",
-                    "Financial Svcs. (Non-bank & Insurance)",
-                    "Insurance (General)",
-                    "Insurance (Life)",
-                    "Insurance (Prop/Cas.)",
-                    "Investments & Asset Management",
-                    "R.E.I.T.",
-                    "Retail (REITs)",
-                    "Reinsurance",
-                )
-            ]),
-            2,
-        )
+    _mgn_data = np.array(
+        [
+            (_v["Number of firms"], _v["Gross Margin"])
+            for _g, _v in _mgn_tbl_dict.items()
+            if not _g.startswith("Total Market") and _g not in _SKIP_INDUSTRIES
+        ],
+        np.float64,
     )
+    _mgn_data_wts, _mgn_data_obs = _mgn_data[:, 0], _mgn_data[:, 1]
 
     _mgn_wtd_avg = np.average(_mgn_data_obs, weights=_mgn_data_wts)
     # https://www.itl.nist.gov/div898/software/dataplot/refman2/ch2/weighvar.pdf
@@ -213,26 +221,72 @@ def mgn_data_resampler(
 
     """
 
+    # Deferred import: scipy is only needed for the KDE bandwidth here
+    from scipy import stats  # type: ignore
+
     _seed_sequence = seed_sequence or SeedSequence(pool_size=8)
 
     _x, _w, _ = mgn_data_builder(mgn_data_getter())
 
     _mgn_kde = stats.gaussian_kde(_x, weights=_w, bw_method="silverman")
     _mgn_kde.set_bandwidth(bw_method=_mgn_kde.factor / 3.0)
+    _kde_bandwidth = np.sqrt(_mgn_kde.covariance[0, 0])
+
+    _prob, _alias = _alias_tables(_w.tobytes())
 
     if isinstance(_sample_size, int):
-        return np.array(
-            _mgn_kde.resample(_sample_size, seed=Generator(PCG64DXSM(_seed_sequence)))[
-                0
-            ]
+        return _resample_mgn_kde(
+            _x, _prob, _alias, _kde_bandwidth, _sample_size,
+            Generator(PCG64DXSM(_seed_sequence)),
         )
     elif isinstance(_sample_size, tuple) and len(_sample_size) == 2:
         _ssz, _num_cols = _sample_size
         _ret_array = np.empty(_sample_size, np.float64)
-        for _idx, _seed_seq in enumerate(_seed_sequence.spawn(_num_cols)):
-            _ret_array[:, _idx] = _mgn_kde.resample(
-                _ssz, seed=Generator(PCG64DXSM(_seed_seq))
-            )[0]
+        _col_rngs = Generator(PCG64DXSM(_seed_sequence)).spawn(_num_cols)
+        for _idx, _col_rng in enumerate(_col_rngs):
+            _ret_array[:, _idx] = _resample_mgn_kde(
+                _x, _prob, _alias, _kde_bandwidth, _ssz, _col_rng
+            )
         return _ret_array
     else:
         raise ValueError(f"Invalid sample size: {_sample_size!r}")
+
+
+def _resample_mgn_kde(
+    _x: ArrayDouble,
+    _prob: ArrayDouble,
+    _alias: ArrayBIGINT,
+    _kde_bandwidth: float,
+    _ssz: int,
+    _rng: Generator,
+    /,
+) -> ArrayDouble:
+    """Draw from the weighted Gaussian KDE in O(1) per draw.
+
+    Support points are sampled by Walker's alias method (two uniforms and
+    one gather per draw, versus the O(log n) searchsorted per draw inside
+    ``gaussian_kde.resample``), then jittered with bandwidth-scaled
+    Gaussian noise.
+    """
+    _k = _rng.integers(0, len(_prob), size=_ssz)
+    _k = np.where(_rng.random(_ssz) >= _prob[_k], _alias[_k], _k)
+    return _x[_k] + _rng.normal(scale=_kde_bandwidth, size=_ssz)
+
+
+@lru_cache(maxsize=4)
+def _alias_tables(_wts_key: bytes, /) -> tuple[ArrayDouble, ArrayBIGINT]:
+    """Construct Walker's alias table for the given sampling weights."""
+    _wts = np.frombuffer(_wts_key, np.float64)
+    _n = len(_wts)
+    _scaled = _wts * (_n / _wts.sum())
+    _prob = np.ones(_n, np.float64)
+    _alias = np.arange(_n, dtype=np.int64)
+    _small = [_i for _i in range(_n) if _scaled[_i] < 1.0]
+    _large = [_i for _i in range(_n) if _scaled[_i] >= 1.0]
+    while _small and _large:
+        _s, _l = _small.pop(), _large.pop()
+        _prob[_s] = _scaled[_s]
+        _alias[_s] = _l
+        _scaled[_l] += _scaled[_s] - 1.0
+        (_small if _scaled[_l] < 1.0 else _large).append(_l)
+    return _prob, _alias
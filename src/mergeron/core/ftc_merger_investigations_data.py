@@ -10,6 +10,8 @@ Reported row and column totals from source data are not stored.
 
 import shutil
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from importlib import resources
 from operator import itemgetter
 from pathlib import Path
@@ -47,6 +49,16 @@ if (
         shutil.copy2(_bundled_copy_path, INVDATA_ARCHIVE_PATH)
 
 TABLE_NO_RE = re.compile(r"Table \d+\.\d+")
+DATA_PERIOD_RE = re.compile(r"\d{4} *- *\d{4}")
+NON_WORD_RE = re.compile(r"\W")
+SKIP_LINE_RE = re.compile(r"Significant Competitors|Post Merger HHI|\d+")
+# Pages layouts not the same in all reports
+PG_HDR_STRINGS = (
+    "FEDERAL TRADE COMMISSION",
+    "HORIZONTAL MERGER INVESTIGATION DATA: FISCAL YEARS 1996 - 2011",
+)
+CONC_ROW_RE = re.compile(r"((?:0|\d,\d{3}) (?:- \d+,\d{3}|\+)|TOTAL)")
+CNT_ROW_RE = re.compile(r"(\d+ (?:to \d+|\+)|TOTAL)")
 TABLE_TYPES = ("ByHHIandDelta", "ByFirmCount")
 CONC_TABLE_ALL = "Table 3.1"
 CNT_TABLE_ALL = "Table 4.1"
@@ -95,7 +107,24 @@ class INVTableData(NamedTuple):
     data_array: ArrayBIGINT
 
 
-INVData: TypeAlias = Mapping[str, dict[str, dict[str, INVTableData]]]
+INVData: TypeAlias = Mapping[str, Mapping[str, Mapping[str, INVTableData]]]
+
+_INVDataMut: TypeAlias = dict[str, dict[str, dict[str, INVTableData]]]
+
+
+def _freeze_invdata(_invdata: _INVDataMut, /) -> INVData:
+    """Freeze constructed data at every level, including the count arrays."""
+    for _subdict in _invdata.values():
+        for _tables in _subdict.values():
+            for _table_data in _tables.values():
+                _table_data.data_array.setflags(write=False)
+    return MappingProxyType({
+        _period: MappingProxyType({
+            _table_type: MappingProxyType(_tables)
+            for _table_type, _tables in _subdict.items()
+        })
+        for _period, _subdict in _invdata.items()
+    })
 
 
 def construct_data(
@@ -135,10 +164,10 @@ def construct_data(
 
     """
     _archive_path = _archive_path or INVDATA_ARCHIVE_PATH
-    if _archive_path.is_file() and not rebuild_data:
+    if not rebuild_data and _archive_is_fresh(_archive_path):
         _archived_data = msgpack.unpackb(_archive_path.read_bytes(), use_list=False)
 
-        _invdata: dict[str, dict[str, dict[str, INVTableData]]] = {}
+        _invdata: _INVDataMut = {}
         for _period in _archived_data:
             _invdata[_period] = {}
             for _table_type in _archived_data[_period]:
@@ -147,7 +176,7 @@ def construct_data(
                     _invdata[_period][_table_type][_table_no] = INVTableData(
                         *_archived_data[_period][_table_type][_table_no]
                     )
-        return MappingProxyType(_invdata)
+        return _freeze_invdata(_invdata)
 
     _invdata = dict(_parse_invdata())  # Convert immutable to mutable
 
@@ -156,12 +185,11 @@ def construct_data(
     #   some incompatibilities
     #   )
     for _data_period in "2004-2011", "2006-2011", "2008-2011":
-        _invdata_bld = _construct_new_period_data(
+        _invdata[_data_period] = _construct_new_period_data(
             _invdata,
             _data_period,
             flag_backward_compatibility=flag_backward_compatibility,
         )
-        _invdata |= {_data_period: _invdata_bld}
 
     # Create data for industries with no evidence on entry
     for _data_period in _invdata:
@@ -185,24 +213,36 @@ def construct_data(
             _aggr_tables_list = [
                 _t
                 for _t in _invdata["1996-2003"][_table_type]
-                if re.sub(
-                    r"\W", "", _invdata["1996-2003"][_table_type][_t].industry_group
+                if NON_WORD_RE.sub(
+                    "", _invdata["1996-2003"][_table_type][_t].industry_group
                 )
                 not in _industry_exclusion_list
             ]
 
-            _invdata_sub_tabletype |= {
-                _table_no.replace(".1", ".X"): _invdata_build_aggregate_table(
-                    _invdata_sub_tabletype, _aggr_tables_list
-                )
-            }
+            _invdata_sub_tabletype[_table_no.replace(".1", ".X")] = (
+                _invdata_build_aggregate_table(_invdata_sub_tabletype, _aggr_tables_list)
+            )
 
-    _ = INVDATA_ARCHIVE_PATH.write_bytes(msgpack.packb(_invdata))
+    with INVDATA_ARCHIVE_PATH.open("wb") as _archive_fh:
+        msgpack.pack(_invdata, _archive_fh)
 
-    return MappingProxyType(_invdata)
+    return _freeze_invdata(_invdata)
+
+
+def _archive_is_fresh(_archive_path: Path, /) -> bool:
+    """Whether the archive exists and is no older than any downloaded report."""
+    if not _archive_path.is_file():
+        return False
+    _archive_mtime = _archive_path.stat().st_mtime
+    return all(
+        _archive_mtime >= _pdf_path.stat().st_mtime
+        for _pdf_path in FTCDATA_DIR.glob("*.pdf")
+    )
 
 
-def _construct_no_entry_evidence_data(_invdata: INVData, _data_period: str, /) -> None:
+def _construct_no_entry_evidence_data(
+    _invdata: _INVDataMut, _data_period: str, /
+) -> None:
     _invdata_ind_grp = "All Markets"
     _invdata_evid_cond = "No Entry Evidence"
 
@@ -300,17 +340,17 @@ def _construct_new_period_data(
                         int(g) for g in _data_period_detail.split("-")
                     )
                     if _pd_start == 1996:
-                        _invdata_cuml_array_stack += [
+                        _invdata_cuml_array_stack.append(
                             _invdata[_data_period_detail][_table_type][
                                 _table_no
                             ].data_array[:, -3:-1]
-                        ]
+                        )
                     if _pd_start == 1996 and _pd_end < int(_data_period.split("-")[0]):
-                        _invdata_base_array_stack += [
+                        _invdata_base_array_stack.append(
                             _invdata[_data_period_detail][_table_type][
                                 _table_no
                             ].data_array[:, -3:-1]
-                        ]
+                        )
                 _invdata_cuml_array_enfcls, _invdata_base_array_enfcls = (
                     np.stack(_f).max(axis=0)
                     for _f in (_invdata_cuml_array_stack, _invdata_base_array_stack)
@@ -430,61 +470,74 @@ def _parse_invdata() -> INVData:
                 "1996-2005",
             ))
 
-        _data_period = re.findall(r"(\d{4}) *(-) *(\d{4})", _invdata_meta["title"])[0]
-        _data_period = "".join(_data_period)
+        _data_period = (
+            DATA_PERIOD_RE.search(_invdata_meta["title"]).group().replace(" ", "")
+        )
+
+        _page_count = _invdata_fitz.page_count
+        _invdata_fitz.close()
 
         # Initialize containers for parsed data
         _invdata[_data_period] = {k: {} for k in TABLE_TYPES}
 
-        for _pdf_pg in _invdata_fitz.pages():
-            _doc_pg_blocks = _pdf_pg.get_text("blocks", sort=False)
-            # Across all published reports of FTC investigations data,
-            #   sorting lines (PDF page blocks) by the lower coordinates
-            #   and then the left coordinates is most effective for
-            #   ordering table rows in top-to-bottom order; this doesn't
-            #   work for the 1996-2005 data, however, so we resort later
-            _doc_pg_blocks = sorted([
-                (f"{_f[3]:03.0f}{_f[0]:03.0f}{_f[1]:03.0f}{_f[2]:03.0f}", *_f)
-                for _f in _doc_pg_blocks
-                if _f[-1] == 0
-            ])
-
-            _data_blocks: list[tuple[str]] = [("",)]
-            # Pages layouts not the same in all reports
-            _pg_hdr_strings = (
-                "FEDERAL TRADE COMMISSION",
-                "HORIZONTAL MERGER INVESTIGATION DATA: FISCAL YEARS 1996 - 2011",
-            )
-            if len(_doc_pg_blocks) > 4:
-                _tnum: re.match = None
-                for _blk_idx, _pg_blk in enumerate(_doc_pg_blocks):
-                    if _tnum := TABLE_NO_RE.fullmatch(_pg_blk[-3].strip()):
-                        _data_blocks = [
-                            _b
-                            for _b in _doc_pg_blocks
-                            if not _b[-3].startswith(_pg_hdr_strings)
-                            and (
-                                _b[-3].strip()
-                                not in ("Significant Competitors", "Post Merger HHI")
-                            )
-                            and not re.fullmatch(r"\d+", _b[-3].strip())
-                        ]
-                        break
-                if not _tnum:
-                    continue
-                del _tnum
-            else:
-                continue
+        # Text extraction is compute-bound in MuPDF's C layer and each
+        # page's table is self-contained, so extract pages in parallel
+        # worker processes and merge the results in page order
+        with ProcessPoolExecutor() as _executor:
+            for _data_blocks in _executor.map(
+                partial(_extract_page_blocks, _invdata_pdf_path), range(_page_count)
+            ):
+                if _data_blocks:
+                    _parse_page_blocks(_invdata, _data_period, _data_blocks)
 
-            _parse_page_blocks(_invdata, _data_period, _data_blocks)
+    return MappingProxyType(_invdata)
 
-        _invdata_fitz.close()
 
-    return MappingProxyType(_invdata)
+def _extract_page_blocks(
+    _pdf_path: Path, _pg_no: int, /
+) -> list[tuple[Any, ...]] | None:
+    """Extract, order, and filter the text blocks of one report page.
+
+    Returns None for pages that don't carry a data table.
+    """
+    import fitz  # type: ignore
+
+    # Text blocks only: skip image extraction and ligature/whitespace
+    # normalization work that the block filter below would discard anyway
+    _text_flags = fitz.TEXTFLAGS_BLOCKS & ~fitz.TEXT_PRESERVE_IMAGES
+
+    with fitz.open(_pdf_path) as _invdata_fitz:
+        _pg_blocks = _invdata_fitz[_pg_no].get_text(
+            "blocks", flags=_text_flags, sort=False
+        )
+
+    # Across all published reports of FTC investigations data,
+    #   sorting lines (PDF page blocks) by the lower coordinates
+    #   and then the left coordinates is most effective for
+    #   ordering table rows in top-to-bottom order; this doesn't
+    #   work for the 1996-2005 data, however, so we resort later
+    _doc_pg_blocks = sorted([
+        (f"{_f[3]:03.0f}{_f[0]:03.0f}{_f[1]:03.0f}{_f[2]:03.0f}", *_f)
+        for _f in _pg_blocks
+        if _f[-1] == 0
+    ])
+
+    if len(_doc_pg_blocks) <= 4:
+        return None
+
+    for _pg_blk in _doc_pg_blocks:
+        if TABLE_NO_RE.fullmatch(_pg_blk[-3].strip()):
+            return [
+                _b
+                for _b in _doc_pg_blocks
+                if not _b[-3].startswith(PG_HDR_STRINGS)
+                and not SKIP_LINE_RE.fullmatch(_b[-3].strip())
+            ]
+    return None
 
 
 def _parse_page_blocks(
-    _invdata: INVData, _data_period: str, _doc_pg_blocks: Sequence[Sequence[Any]], /
+    _invdata: _INVDataMut, _data_period: str, _doc_pg_blocks: Sequence[Sequence[Any]], /
 ) -> None:
     if _data_period != "1996-2011":
         _parse_table_blocks(_invdata, _data_period, _doc_pg_blocks)
@@ -511,7 +564,7 @@ def _parse_page_blocks(
 
 
 def _parse_table_blocks(
-    _invdata: INVData, _data_period: str, _table_blocks: Sequence[Sequence[str]], /
+    _invdata: _INVDataMut, _data_period: str, _table_blocks: Sequence[Sequence[str]], /
 ) -> None:
     _invdata_evid_cond = "Unrestricted on additional evidence"
     _table_num, _table_ser, _table_type = _identify_table_type(
@@ -574,27 +627,28 @@ def _parse_table_blocks(
         print(_table_blocks)
         raise ValueError
 
-    _table_data = INVTableData(_invdata_ind_group, _invdata_evid_cond, _table_array)
-    _invdata[_data_period][_table_type] |= {_table_num: _table_data}
+    _invdata[_data_period][_table_type][_table_num] = INVTableData(
+        _invdata_ind_group, _invdata_evid_cond, _table_array
+    )
 
 
 def _identify_table_type(_tnstr: str = CONC_TABLE_ALL, /) -> tuple[str, int, str]:
-    _tnum = _tnstr.split(" ")[1]
-    _tsub = int(_tnum.split(".")[0])
+    # Slice on the separator positions; str.split would allocate a list
+    # of segments just to take the first of each
+    _tnum = _tnstr[_tnstr.index(" ") + 1 :]
+    _tsub = int(_tnum[: _tnum.index(".")])
     return _tnstr, _tsub, TABLE_TYPES[(_tsub + 1) % 2]
 
 
 def _process_table_blks_conc_type(
     _table_blocks: Sequence[Sequence[str]], /
 ) -> ArrayBIGINT:
-    _conc_row_pat = re.compile(r"((?:0|\d,\d{3}) (?:- \d+,\d{3}|\+)|TOTAL)")
-
     _col_titles_array = tuple(CONC_DELTA_DICT.values())
     _col_totals: ArrayBIGINT = np.zeros(len(_col_titles_array), np.int64)
-    _invdata_array: ArrayBIGINT = np.array(None)
+    _row_array_stack: list[ArrayBIGINT] = []
 
     for _tbl_blk in _table_blocks:
-        if _conc_row_pat.match(_blk_str := _tbl_blk[-3]):
+        if CONC_ROW_RE.match(_blk_str := _tbl_blk[-3]):
             _row_list: list[str] = _blk_str.strip().split("\n")
             _row_title: str = _row_list.pop(0)
             _row_key: int = CONC_HHI_DICT[_row_title]
@@ -602,15 +656,13 @@ def _process_table_blks_conc_type(
             _row_array_list: list[list[int]] = []
             while _row_list:
                 _enfd_val, _clsd_val = _row_list.pop(0).split("/")
-                _row_array_list += [
-                    [
-                        _row_key,
-                        _col_titles_array[len(_row_array_list)],
-                        int(_enfd_val),
-                        int(_clsd_val),
-                        int(_enfd_val) + int(_clsd_val),
-                    ]
-                ]
+                _row_array_list.append([
+                    _row_key,
+                    _col_titles_array[len(_row_array_list)],
+                    int(_enfd_val),
+                    int(_clsd_val),
+                    int(_enfd_val) + int(_clsd_val),
+                ])
             _row_array = np.array(_row_array_list, np.int64)
             # Check row totals
             assert_array_equal(_row_total, np.einsum("ij->j", _row_array[:, 2:4]))
@@ -618,15 +670,14 @@ def _process_table_blks_conc_type(
             if _row_key == TTL_KEY:
                 _col_totals = _row_array
             else:
-                _invdata_array = (
-                    np.vstack((_invdata_array, _row_array))
-                    if _invdata_array.shape
-                    else _row_array
-                )
+                _row_array_stack.append(_row_array)
             del _row_array, _row_array_list
         else:
             continue
 
+    # Single allocation for the parsed rows, in place of repeated vstack
+    _invdata_array: ArrayBIGINT = np.vstack(_row_array_stack)
+
     # Check column totals
     for _col_tot in _col_totals:
         assert_array_equal(
@@ -644,13 +695,11 @@ def _process_table_blks_conc_type(
 def _process_table_blks_cnt_type(
     _table_blocks: Sequence[Sequence[str]], /
 ) -> ArrayBIGINT:
-    _cnt_row_pat = re.compile(r"(\d+ (?:to \d+|\+)|TOTAL)")
-
-    _invdata_array: ArrayBIGINT = np.array(None)
+    _row_array_stack: list[ArrayBIGINT] = []
     _col_totals: ArrayBIGINT = np.zeros(3, np.int64)  # "enforced", "closed", "total"
 
     for _tbl_blk in _table_blocks:
-        if _cnt_row_pat.match(_blk_str := _tbl_blk[-3]):
+        if CNT_ROW_RE.match(_blk_str := _tbl_blk[-3]):
             _row_list_s = _blk_str.strip().replace(",", "").split("\n")
             _row_list = np.array(
                 [CNT_FCOUNT_DICT[_row_list_s[0]], *_row_list_s[1:]], np.int64
@@ -663,14 +712,13 @@ def _process_table_blks_cnt_type(
             if _row_list[0] == TTL_KEY:
                 _col_totals = _row_list
             else:
-                _invdata_array = (
-                    np.vstack((_invdata_array, _row_list))
-                    if _invdata_array.shape
-                    else _row_list
-                )
+                _row_array_stack.append(_row_list)
         else:
             continue
 
+    # Single allocation for the parsed rows, in place of repeated vstack
+    _invdata_array: ArrayBIGINT = np.vstack(_row_array_stack)
+
     if not np.array_equal(
         np.array([int(f) for f in _col_totals[1:]], np.int64),
         np.einsum("ij->j", _invdata_array[:, 1:]),
@@ -703,7 +751,7 @@ def _download_invdata(_dl_path: Path = FTCDATA_DIR) -> tuple[str, ...]:
     ):
         return _invdata_docnames
 
-    _invdata_docnames_dl: tuple[str, ...] = ()
+    _invdata_docnames_dl: list[str] = []
     _u3pm = urllib3.PoolManager()
     _chunk_size = 1024 * 1024
     for _invdata_homepage_url in _invdata_homepage_urls:
@@ -718,7 +766,7 @@ def _download_invdata(_dl_path: Path = FTCDATA_DIR) -> tuple[str, ...]:
             ]
         for _invdata_attr in _invdata_attrs:
             _invdata_docname, _invdata_link = _invdata_attr
-            _invdata_docnames_dl += (_invdata_docname,)
+            _invdata_docnames_dl.append(_invdata_docname)
             with (
                 _u3pm.request(
                     "GET", f"https://www.ftc.gov/{_invdata_link}", preload_content=False
@@ -731,7 +779,7 @@ def _download_invdata(_dl_path: Path = FTCDATA_DIR) -> tuple[str, ...]:
                         break
                     _invdata_fh.write(_data)
 
-    return _invdata_docnames_dl
+    return tuple(_invdata_docnames_dl)
 
 
 if __name__ == "__main__":
@@ -21,6 +21,11 @@ __version__ = VERSION
 NTHREADS = 2 * cpu_count()
 DIST_PARMS_DEFAULT = np.array([0.0, 1.0], np.float64)
 
+# One shared pool for all fills: generator methods release the GIL, and
+# each task writes a disjoint slab, so queuing extra chunks is harmless
+# while constructing a fresh pool per RNG instance is not free
+_FILL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(NTHREADS)
+
 
 def prng(_s: SeedSequence | None = None, /) -> np.random.Generator:
     """Adopt the PCG64DXSM bit-generator, the future default in numpy.default_rng().
@@ -128,6 +133,10 @@ class MultithreadedRNG:
         SeedSequence object for generating repeatable draws.
     nthreads
         Number of threads to spawn for random number generation.
+    affine_transform
+        Optional (scale, shift) applied to each chunk inside the fill
+        worker, while the chunk is still cache-resident, saving a
+        second full pass over the output array.
 
     """
 
@@ -142,13 +151,16 @@ class MultithreadedRNG:
         dist_parms: ArrayDouble | None = DIST_PARMS_DEFAULT,
         seed_sequence: SeedSequence | None = None,
         nthreads: int = NTHREADS,
+        affine_transform: tuple[float, float] | None = None,
     ):
         self.thread_count = nthreads
+        self.affine_transform = affine_transform
 
+        # Generator.spawn fans out child generators from the same seed
+        # sequence in one step, with streams identical to spawning the
+        # SeedSequence manually and wrapping each child in prng()
         _seed_sequence = seed_sequence or SeedSequence(pool_size=8)
-        self._random_generators = [
-            prng(_t) for _t in _seed_sequence.spawn(self.thread_count)
-        ]
+        self._random_generators = prng(_seed_sequence).spawn(self.thread_count)
 
         self.sample_sz = len(_out_array)
 
@@ -195,7 +207,7 @@ class MultithreadedRNG:
         self.dist_parms = dist_parms
 
         self.values = _out_array
-        self.executor = concurrent.futures.ThreadPoolExecutor(self.thread_count)
+        self.executor = _FILL_EXECUTOR
 
         self.step_size = (len(self.values) / self.thread_count).__ceil__()
 
@@ -229,6 +241,11 @@ class MultithreadedRNG:
                 case _:
                     _rng.standard_normal(out=_out[_first:_last])
 
+            if self.affine_transform is not None:
+                _scale, _shift = self.affine_transform
+                _out[_first:_last] *= _scale
+                _out[_first:_last] += _shift
+
         futures = {}
         for i in range(self.thread_count):
             _range_first = i * self.step_size
@@ -244,6 +261,3 @@ class MultithreadedRNG:
             )
             futures[self.executor.submit(*args)] = i  # type: ignore
         concurrent.futures.wait(futures)
-
-    def __del__(self) -> None:
-        self.executor.shutdown(False)
@@ -5,10 +5,12 @@ Methods to generate data for analyzing merger enforcement policy.
 
 from __future__ import annotations
 
+import math
 from collections.abc import Sequence
 from typing import TypedDict
 
 import numpy as np
+import numpy.typing as npt
 from attrs import Attribute, define, field, validators
 from joblib import Parallel, cpu_count, delayed  # type: ignore
 from numpy.random import SeedSequence
@@ -66,6 +68,33 @@ class SamplingFunctionKWArgs(TypedDict, total=False):
     saved_array_name_suffix: str
     """optionally specify a suffix for the HDF5 array names"""
 
+    packed: bool
+    """optionally repack the float arrays of the generated sample into one
+    contiguous block, with the sample's attributes as column views into it
+
+    Row-wise consumers then read a single contiguous row rather than
+    chasing eight separately allocated arrays.
+
+    """
+
+    dtype: npt.DTypeLike
+    """optionally store the generated float arrays at reduced precision
+
+    Generation always runs in float64; specifying, e.g., np.float32 halves
+    the memory footprint and bandwidth of the stored sample for downstream
+    consumers that don't need full precision.
+
+    """
+
+    compute_hhi: bool
+    """optionally skip computing concentration measures
+
+    When False, the sample's hhi_post and hhi_delta attributes are NaN
+    placeholders, saving a scan of the full market-share array on calls
+    that only use shares, margins, and diversion ratios.
+
+    """
+
 
 @define
 class MarketSample:
@@ -113,7 +142,7 @@ class MarketSample:
 
     enf_counts: UPPTestsCounts = field(default=None)
 
-    def gen_market_sample(
+    def gen_market_sample(  # noqa: PLR0913
         self,
         /,
         *,
@@ -122,6 +151,9 @@ class MarketSample:
         nthreads: int = 16,
         save_data_to_file: SaveData = False,
         saved_array_name_suffix: str = "",
+        packed: bool = False,
+        dtype: npt.DTypeLike = np.float64,
+        compute_hhi: bool = True,
     ) -> MarketDataSample:
         """
         Generate share, diversion ratio, price, and margin data for MarketSpec.
@@ -148,12 +180,14 @@ class MarketSample:
             _pr_rng_seed_seq,
         ) = parse_seed_seq_list(seed_seq_list, _dist_type_mktshr, self.price_spec)
 
-        _shr_sample_size = 1.0 * sample_size
-        # Scale up sample size to offset discards based on specified criteria
-        _shr_sample_size *= _hsr_filing_test_type
-        if _dist_firm2_pcm == FM2Constraint.MNL:
-            _shr_sample_size *= SSZConstant.MNL_DEP
-        _shr_sample_size = int(_shr_sample_size)
+        # Scale up sample size to offset discards based on specified criteria;
+        # a single expression with ceil gives predictable rounding rather than
+        # truncating after a float round-trip
+        _shr_sample_size = math.ceil(
+            sample_size
+            * _hsr_filing_test_type
+            * (SSZConstant.MNL_DEP if _dist_firm2_pcm == FM2Constraint.MNL else 1.0)
+        )
 
         # Generate share data
         _mktshr_data = gen_share_data(
@@ -164,15 +198,10 @@ class MarketSample:
             nthreads,
         )
 
-        _mktshr_array, _fcounts, _aggregate_purchase_prob, _nth_firm_share = (
-            getattr(_mktshr_data, _f)
-            for _f in (
-                "mktshr_array",
-                "fcounts",
-                "aggregate_purchase_prob",
-                "nth_firm_share",
-            )
-        )
+        _mktshr_array = _mktshr_data.mktshr_array
+        _fcounts = _mktshr_data.fcounts
+        _aggregate_purchase_prob = _mktshr_data.aggregate_purchase_prob
+        _nth_firm_share = _mktshr_data.nth_firm_share
 
         # Generate merging-firm price and PCM data
         _margin_data, _price_data = gen_margin_price_data(
@@ -188,24 +217,49 @@ class MarketSample:
         )
 
         _price_array, _hsr_filing_test = (
-            getattr(_price_data, _f) for _f in ("price_array", "hsr_filing_test")
+            _price_data.price_array,
+            _price_data.hsr_filing_test,
         )
 
         _pcm_array, _mnl_test_rows = (
-            getattr(_margin_data, _f) for _f in ("pcm_array", "mnl_test_array")
+            _margin_data.pcm_array,
+            _margin_data.mnl_test_array,
         )
 
-        _mnl_test_rows = _mnl_test_rows * _hsr_filing_test
         _s_size = sample_size  # originally-specified sample size
         if _dist_firm2_pcm == FM2Constraint.MNL:
-            _mktshr_array = _mktshr_array[_mnl_test_rows][:_s_size]
-            _pcm_array = _pcm_array[_mnl_test_rows][:_s_size]
-            _price_array = _price_array[_mnl_test_rows][:_s_size]
-            _fcounts = _fcounts[_mnl_test_rows][:_s_size]
-            _aggregate_purchase_prob = _aggregate_purchase_prob[_mnl_test_rows][
-                :_s_size
-            ]
-            _nth_firm_share = _nth_firm_share[_mnl_test_rows][:_s_size]
+            # In-place AND stays in bool dtype; the standalone MNL flags are
+            # not needed once combined with the filing test
+            np.logical_and(_mnl_test_rows, _hsr_filing_test, out=_mnl_test_rows)
+            # A single nonzero scan, truncated to the requested sample size,
+            # is shared across all gathers; boolean masking would repeat the
+            # scan per array and copy rows past the cutoff only to discard them
+            _keep_idx = np.flatnonzero(_mnl_test_rows)[:_s_size]
+            if len(_keep_idx) < _s_size:
+                raise ValueError(
+                    "DATA GENERATION ERROR: {} {}".format(
+                        f"Scaled-up sample yielded only {len(_keep_idx):,d} accepted",
+                        f"draws of the {_s_size:,d} requested.",
+                    )
+                )
+            (
+                _mktshr_array,
+                _pcm_array,
+                _price_array,
+                _fcounts,
+                _aggregate_purchase_prob,
+                _nth_firm_share,
+            ) = (
+                np.take(_f, _keep_idx, axis=0)
+                for _f in (
+                    _mktshr_array,
+                    _pcm_array,
+                    _price_array,
+                    _fcounts,
+                    _aggregate_purchase_prob,
+                    _nth_firm_share,
+                )
+            )
 
         # Calculate diversion ratios
         _divr_array = gen_divr_array(
@@ -218,15 +272,21 @@ class MarketSample:
         del _mnl_test_rows, _s_size
 
         _frmshr_array = _mktshr_array[:, :2]
-        _hhi_delta = np.einsum("ij,ij->i", _frmshr_array, _frmshr_array[:, ::-1])[
-            :, None
-        ]
-
-        _hhi_post = (
-            _hhi_delta + np.einsum("ij,ij->i", _mktshr_array, _mktshr_array)[:, None]
-        )
+        if compute_hhi:
+            # s_1 s_2 + s_2 s_1 == 2 s_1 s_2, so the delta needs no reversed-view
+            # einsum; the post-merger HHI then costs one scan of _mktshr_array
+            _hhi_delta = (2 * _frmshr_array[:, 0] * _frmshr_array[:, 1])[:, None]
+
+            _hhi_post = (
+                _hhi_delta
+                + np.einsum("ij,ij->i", _mktshr_array, _mktshr_array)[:, None]
+            )
+        else:
+            # Placeholders keep the container shape for packing and downcasts
+            _hhi_delta = np.nan * np.empty((len(_frmshr_array), 1))
+            _hhi_post = _hhi_delta
 
-        return MarketDataSample(
+        _mkt_data = MarketDataSample(
             _frmshr_array,
             _pcm_array,
             _price_array,
@@ -238,6 +298,16 @@ class MarketSample:
             _hhi_delta,
         )
 
+        if packed:
+            return _pack_market_data(_mkt_data, dtype=dtype)
+        if (_dtype := np.dtype(dtype)) != np.float64:
+            # Storage-only downcast: generation runs in float64 throughout
+            _mkt_data = MarketDataSample(
+                fcounts=_mkt_data.fcounts,
+                **{_f: getattr(_mkt_data, _f).astype(_dtype) for _f in _PACKED_FIELDS},
+            )
+        return _mkt_data
+
     def generate_sample(
         self,
         /,
@@ -527,3 +597,39 @@ class MarketSample:
                     save_data_to_file=save_data_to_file,
                     saved_array_name_suffix=saved_array_name_suffix,
                 )
+
+
+_PACKED_FIELDS = (
+    "frmshr_array",
+    "pcm_array",
+    "price_array",
+    "aggregate_purchase_prob",
+    "nth_firm_share",
+    "divr_array",
+    "hhi_post",
+    "hhi_delta",
+)
+
+
+def _pack_market_data(
+    _mkt_data: MarketDataSample, /, *, dtype: npt.DTypeLike = np.float64
+) -> MarketDataSample:
+    """Repack the float arrays of a market data sample into one block.
+
+    The returned sample's float attributes are column views into a single
+    contiguous (N, 12) array, so consumers that walk the sample row-wise
+    touch one cache-resident row instead of eight separately allocated
+    arrays. Firm counts keep their own integer array.
+    """
+
+    _widths = [getattr(_mkt_data, _f).shape[1] for _f in _PACKED_FIELDS]
+    _packed_array = np.empty((len(_mkt_data.frmshr_array), sum(_widths)), dtype)
+
+    _views: dict[str, np.ndarray] = {}
+    _col = 0
+    for _f, _w in zip(_PACKED_FIELDS, _widths, strict=True):
+        _packed_array[:, _col : _col + _w] = getattr(_mkt_data, _f)
+        _views[_f] = _packed_array[:, _col : _col + _w]
+        _col += _w
+
+    return MarketDataSample(fcounts=_mkt_data.fcounts, **_views)
@@ -25,7 +25,6 @@ from ..core.pseudorandom_numbers import (  # noqa: TID252
     prng,
 )
 from . import (
-    EMPTY_ARRAY_DEFAULT,
     FCOUNT_WTS_DEFAULT,
     FM2Constraint,
     MarginDataSample,
@@ -42,6 +41,10 @@ from . import (
 
 __version__ = VERSION
 
+# Root for unseeded streams: spawning children off one mixed entropy pool
+# is much cheaper than mixing a fresh pool per stream on every call
+_ROOT_SEED_SEQ = SeedSequence(pool_size=8)
+
 
 def gen_share_data(
     _sample_size: int,
@@ -157,14 +160,15 @@ def gen_market_shares_uniform(
     )
     _mrng.fill()
     # Convert draws on U[0, 1] to Uniformly-distributed draws on simplex, s_1 + s_2 <= 1
-    _frmshr_array.sort(axis=1)
-    _frmshr_array = np.column_stack((
-        _frmshr_array[:, 0],
-        _frmshr_array[:, 1] - _frmshr_array[:, 0],
-    ))
+    # Branchless min/max over the two columns, written back in place, replaces
+    # the row-sort and column-stack, halving the passes over the array
+    _lo = np.minimum(_frmshr_array[:, 0], _frmshr_array[:, 1])
+    _hi = np.maximum(_frmshr_array[:, 0], _frmshr_array[:, 1])
+    _frmshr_array[:, 0] = _lo
+    _frmshr_array[:, 1] = _hi - _lo
 
     # Keep only share combinations representing feasible mergers
-    _frmshr_array = _frmshr_array[_frmshr_array.min(axis=1) > 0]
+    _frmshr_array = _frmshr_array[(_lo > 0) & (_hi > _lo)]
 
     # Let a third column have values of "np.nan", so HHI calculations return "np.nan"
     _mktshr_array = np.pad(
@@ -181,7 +185,7 @@ def gen_market_shares_uniform(
     )
 
 
-def gen_market_shares_dirichlet_multimarket(
+def gen_market_shares_dirichlet_multimarket(  # noqa: PLR0915
     _s_size: int = 10**6,
     _recapture_form: RECForm = RECForm.INOUT,
     _dist_type_dir: SHRDistribution = SHRDistribution.DIR_FLAT,
@@ -233,17 +237,10 @@ def gen_market_shares_dirichlet_multimarket(
     )
 
     _min_choice_wt = 0.03 if _dist_type_dir == SHRDistribution.DIR_FLAT_CONSTR else 0.00
-    _fcount_keys, _choice_wts = zip(
-        *(
-            _f
-            for _f in zip(
-                2 + np.arange(len(_firm_count_wts)),
-                _firm_count_wts / _firm_count_wts.sum(),
-                strict=True,
-            )
-            if _f[1] > _min_choice_wt
-        )
-    )
+    _norm_wts = _firm_count_wts / _firm_count_wts.sum()
+    _wt_mask = _norm_wts > _min_choice_wt
+    _fcount_keys = (2 + np.arange(len(_firm_count_wts)))[_wt_mask]
+    _choice_wts = _norm_wts[_wt_mask]
     _choice_wts = _choice_wts / sum(_choice_wts)
 
     _fc_max = _fcount_keys[-1]
@@ -266,23 +263,88 @@ def gen_market_shares_dirichlet_multimarket(
         def _gen_dir_alphas(_fcv: int) -> ArrayDouble:
             return np.array(_dir_alphas_full[:_fcv], dtype=np.float64)  # type: ignore
 
-    _fcounts = prng(_fcount_rng_seed_seq).choice(
-        _fcount_keys, size=(_s_size, 1), p=_choice_wts
-    )
+    # Inline the cumulative-probability inversion that Generator.choice runs
+    # internally: searchsorted over this handful of keys draws the identical
+    # stream while skipping choice's general-purpose setup per call
+    _fcount_cdf = np.cumsum(_choice_wts)
+    _fcount_cdf /= _fcount_cdf[-1]
+    _fcounts = np.asarray(_fcount_keys, np.int64)[
+        np.searchsorted(
+            _fcount_cdf, prng(_fcount_rng_seed_seq).random((_s_size, 1)), side="right"
+        )
+    ]
+
+    if _dist_type_dir in (SHRDistribution.DIR_FLAT, SHRDistribution.DIR_FLAT_CONSTR):
+        # The shape parameters for a given firm-count are a prefix of
+        # _dir_alphas_full, and zeroing the trailing columns of a Dirichlet
+        # draw and renormalizing yields a Dirichlet draw on the leading
+        # columns with the prefix parameters (aggregation property). A single
+        # full-width draw thus serves all firm-counts, replacing one PRNG
+        # launch and one pad-copy per firm-count with one launch and no copies
+        _n_cols = _fc_max + (1 if _recapture_form == RECForm.OUTIN else 0)
+        _keep_cols = (
+            _fcounts + 1 if _recapture_form == RECForm.OUTIN else _fcounts
+        )
+
+        _mktshr_array = np.empty((_s_size, _n_cols), dtype=np.float64)
+        _mrng = MultithreadedRNG(
+            _mktshr_array,
+            dist_type="Dirichlet",
+            dist_parms=np.array(
+                [*_dir_alphas_full, _dir_alphas_full[-1]][:_n_cols], dtype=np.float64
+            ),
+            seed_sequence=_mktshr_rng_seed_seq,
+            nthreads=_nthreads,
+        )
+        _mrng.fill()
+
+        _mktshr_array[np.arange(_n_cols) >= _keep_cols] = 0.0
+        _mktshr_array /= np.einsum("ij->i", _mktshr_array)[:, None]
+
+        if _recapture_form == RECForm.OUTIN:
+            _aggregate_purchase_prob = 1 - np.take_along_axis(
+                _mktshr_array, _fcounts, axis=1
+            )
+            np.put_along_axis(_mktshr_array, _fcounts, 0.0, axis=1)
+            _mktshr_array = _mktshr_array[:, :_fc_max] / _aggregate_purchase_prob
+        else:
+            _aggregate_purchase_prob = np.nan * np.empty((_s_size, 1))
+
+        _nth_firm_share = np.take_along_axis(_mktshr_array, _fcounts - 1, axis=1)
+
+        return ShareDataSample(
+            _mktshr_array, _fcounts, _nth_firm_share, _aggregate_purchase_prob
+        )
 
     _mktshr_seed_seq_ch = (
         _mktshr_rng_seed_seq.spawn(len(_fcount_keys))
         if isinstance(_mktshr_rng_seed_seq, SeedSequence)
-        else SeedSequence(pool_size=8).spawn(len(_fcounts))
+        else _ROOT_SEED_SEQ.spawn(len(_fcounts))
+    )
+
+    # Build the alpha table once, and group rows by firm count with a single
+    # stable argsort instead of one full equality scan per firm count; within
+    # each group the row order matches what np.where would produce
+    _dir_alphas_by_fcount = {_f_val: _gen_dir_alphas(_f_val) for _f_val in _fcount_keys}
+    _sorted_rows = np.argsort(_fcounts[:, 0], kind="stable")
+    _match_rows_by_fcount = dict(
+        zip(
+            _fcount_keys,
+            np.split(
+                _sorted_rows,
+                np.searchsorted(_fcounts[_sorted_rows, 0], _fcount_keys[1:]),
+            ),
+            strict=True,
+        )
     )
 
     _aggregate_purchase_prob, _nth_firm_share = (
         np.empty((_s_size, 1)) for _ in range(2)
     )
-    _mktshr_array = np.empty((_s_size, _fc_max), dtype=np.float64)
+    _mktshr_array = np.zeros((_s_size, _fc_max), dtype=np.float64)
     for _f_val, _f_sseq in zip(_fcount_keys, _mktshr_seed_seq_ch, strict=True):
-        _fcounts_match_rows = np.where(_fcounts == _f_val)[0]
-        _dir_alphas_test = _gen_dir_alphas(_f_val)
+        _fcounts_match_rows = _match_rows_by_fcount[_f_val]
+        _dir_alphas_test = _dir_alphas_by_fcount[_f_val]
 
         try:
             _mktshr_sample_f = gen_market_shares_dirichlet(
@@ -296,19 +358,22 @@ def gen_market_shares_dirichlet_multimarket(
             print(_f_val, len(_fcounts_match_rows))
             raise _err
 
-        # Push data for present sample to parent
-        _mktshr_array[_fcounts_match_rows] = np.pad(
-            _mktshr_sample_f.mktshr_array,
-            ((0, 0), (0, _fc_max - _mktshr_sample_f.mktshr_array.shape[1])),
-            "constant",
-        )
+        # Push data for present sample to parent; writing only the populated
+        # columns leaves the zero-initialized tail in place, where np.pad
+        # allocated and copied a widened array every iteration
+        _mktshr_array[
+            _fcounts_match_rows, : _mktshr_sample_f.mktshr_array.shape[1]
+        ] = _mktshr_sample_f.mktshr_array
         _aggregate_purchase_prob[_fcounts_match_rows] = (
             _mktshr_sample_f.aggregate_purchase_prob
         )
         _nth_firm_share[_fcounts_match_rows] = _mktshr_sample_f.nth_firm_share
 
-    if (_iss := np.round(np.einsum("ij->", _mktshr_array))) != _s_size or _iss != len(
-        _mktshr_array
+    # Debug-only: rows sum to 1 by construction, so the grand total must
+    # equal the sample size; python -O skips the full-array reduction
+    if __debug__ and (
+        (_iss := np.round(_mktshr_array.sum())) != _s_size
+        or _iss != len(_mktshr_array)
     ):
         raise ValueError(
             "DATA GENERATION ERROR: {} {} {}".format(
@@ -367,7 +432,7 @@ def gen_market_shares_dirichlet(
     _mktshr_seed_seq_ch = (
         _mktshr_rng_seed_seq
         if isinstance(_mktshr_rng_seed_seq, SeedSequence)
-        else SeedSequence(pool_size=8)
+        else _ROOT_SEED_SEQ.spawn(1)[0]
     )
 
     _mktshr_array = np.empty((_s_size, len(_dir_alphas)))
@@ -380,8 +445,9 @@ def gen_market_shares_dirichlet(
     )
     _mrng.fill()
 
-    if (_iss := np.round(np.einsum("ij->", _mktshr_array))) != _s_size or _iss != len(
-        _mktshr_array
+    if __debug__ and (
+        (_iss := np.round(_mktshr_array.sum())) != _s_size
+        or _iss != len(_mktshr_array)
     ):
         print(_dir_alphas, _iss, repr(_s_size), len(_mktshr_array))
         print(repr(_mktshr_array[-10:, :]))
@@ -396,13 +462,13 @@ def gen_market_shares_dirichlet(
     # If recapture_form == 'inside_out', further calculations downstream
     _aggregate_purchase_prob = np.nan * np.empty((_s_size, 1))
     if _recapture_form == RECForm.OUTIN:
-        _aggregate_purchase_prob = 1 - _mktshr_array[:, [-1]]
+        _aggregate_purchase_prob = 1 - _mktshr_array[:, -1:]
         _mktshr_array = _mktshr_array[:, :-1] / _aggregate_purchase_prob
 
     return ShareDataSample(
         _mktshr_array,
         (_mktshr_array.shape[-1] * np.ones((_s_size, 1))).astype(np.int64),
-        _mktshr_array[:, [-1]],
+        _mktshr_array[:, -1:],
         _aggregate_purchase_prob,
     )
 
@@ -411,7 +477,7 @@ def gen_divr_array(
     _recapture_form: RECForm,
     _recapture_rate: float | None,
     _frmshr_array: ArrayDouble,
-    _aggregate_purchase_prob: ArrayDouble = EMPTY_ARRAY_DEFAULT,
+    _aggregate_purchase_prob: ArrayDouble | None = None,
     /,
 ) -> ArrayDouble:
     """
@@ -450,30 +516,45 @@ def gen_divr_array(
 
     _divr_array: ArrayDouble
     if _recapture_form == RECForm.FIXED:
-        _divr_array = _recapture_rate * _frmshr_array[:, ::-1] / (1 - _frmshr_array)  # type: ignore
+        _divr_array = np.empty_like(_frmshr_array)
+        _divr_array[:, 0] = _recapture_rate * _frmshr_array[:, 1] / (1 - _frmshr_array[:, 0])  # type: ignore
+        _divr_array[:, 1] = _recapture_rate * _frmshr_array[:, 0] / (1 - _frmshr_array[:, 1])  # type: ignore
 
     else:
-        _purchprob_array = _aggregate_purchase_prob * _frmshr_array
-        _divr_array = _purchprob_array[:, ::-1] / (1 - _purchprob_array)
-
-    _divr_assert_test = (
-        (np.round(np.einsum("ij->i", _frmshr_array), 15) == 1)
-        | (np.argmin(_frmshr_array, axis=1) == np.argmax(_divr_array, axis=1))
-    )[:, None]
-    if not all(_divr_assert_test):
-        raise ValueError(
-            "{} {} {} {}".format(
-                "Data construction fails tests:",
-                "the index of min(s_1, s_2) must equal",
-                "the index of max(d_12, d_21), for all draws.",
-                "unless frmshr_array sums to 1.00.",
+        if _aggregate_purchase_prob is None:
+            raise ValueError(
+                "Aggregate purchase probability is required unless "
+                "recapture is specified as proportional."
             )
+        # Column-wise evaluation sidesteps the (N, 2) choice-probability
+        # temporary, its complement, and the strided reversed-view read
+        _purchprob_0 = _aggregate_purchase_prob[:, 0] * _frmshr_array[:, 0]
+        _purchprob_1 = _aggregate_purchase_prob[:, 0] * _frmshr_array[:, 1]
+        _divr_array = np.empty_like(_frmshr_array)
+        _divr_array[:, 0] = _purchprob_1 / (1 - _purchprob_0)
+        _divr_array[:, 1] = _purchprob_0 / (1 - _purchprob_1)
+
+    if __debug__:
+        # Two-column comparisons replace the einsum row-sum and the
+        # argmin/argmax passes; skipped entirely under python -O
+        _row_sum_one = np.abs(_frmshr_array[:, 0] + _frmshr_array[:, 1] - 1.0) < 1e-15
+        _idx_match = (_frmshr_array[:, 0] <= _frmshr_array[:, 1]) == (
+            _divr_array[:, 0] >= _divr_array[:, 1]
         )
+        if not (_row_sum_one | _idx_match).all():
+            raise ValueError(
+                "{} {} {} {}".format(
+                    "Data construction fails tests:",
+                    "the index of min(s_1, s_2) must equal",
+                    "the index of max(d_12, d_21), for all draws.",
+                    "unless frmshr_array sums to 1.00.",
+                )
+            )
 
     return _divr_array
 
 
-def gen_margin_price_data(
+def gen_margin_price_data(  # noqa: PLR0915
     _frmshr_array: ArrayDouble,
     _nth_firm_share: ArrayDouble,
     _aggregate_purchase_prob: ArrayDouble,
@@ -525,30 +606,31 @@ def gen_margin_price_data(
         Simulated margin- and price-data arrays for mergers in the sample.
     """
 
-    _price_array, _price_ratio_array = (
-        np.ones_like(_frmshr_array, np.float64),
-        np.empty_like(_frmshr_array, np.float64),
-    )
-
+    # Each branch below binds _price_array itself; preallocating here would
+    # only add a throwaway fill-and-write pass per call
     _pr_max_ratio = 5.0
     match _price_spec:
         case PriceSpec.SYM:
+            _price_array = np.ones_like(_frmshr_array, np.float64)
             _nth_firm_price = np.ones((len(_frmshr_array), 1))
         case PriceSpec.POS:
+            # Prices lie on a 5-level lattice, so carry them as int8 and
+            # promote to float64 only where revenues are computed below
             _price_array, _nth_firm_price = (
-                np.ceil(_p * _pr_max_ratio) for _p in (_frmshr_array, _nth_firm_share)
+                np.ceil(_p * _pr_max_ratio).astype(np.int8)
+                for _p in (_frmshr_array, _nth_firm_share)
             )
         case PriceSpec.NEG:
             _price_array, _nth_firm_price = (
-                np.ceil((1 - _p) * _pr_max_ratio)
+                np.ceil((1 - _p) * _pr_max_ratio).astype(np.int8)
                 for _p in (_frmshr_array, _nth_firm_share)
             )
         case PriceSpec.ZERO:
             _price_array_gen = prng(_pr_rng_seed_seq).choice(
                 1 + np.arange(_pr_max_ratio), size=(len(_frmshr_array), 3)
-            )
+            ).astype(np.int8)
             _price_array = _price_array_gen[:, :2]
-            _nth_firm_price = _price_array_gen[:, [2]]
+            _nth_firm_price = _price_array_gen[:, 2:3]
             # del _price_array_gen
         case PriceSpec.CSY:
             # TODO:
@@ -572,26 +654,21 @@ def gen_margin_price_data(
 
             _price_array_here = 1 / (1 - _pcm_array)
             _price_array = _price_array_here[:, :2]
-            _nth_firm_price = _price_array_here[:, [-1]]
+            _nth_firm_price = _price_array_here[:, -1:]
             if _pcm_spec.firm2_pcm_constraint == FM2Constraint.MNL:
                 # Generate i.i.d. PCMs then take PCM0 and construct PCM1
-                # Regenerate MNL test
-                _purchase_prob_array = _aggregate_purchase_prob * _frmshr_array
-                _pcm_array[:, 1] = np.divide(
-                    (
-                        _m1_nr := np.divide(
-                            np.einsum(
-                                "ij,ij,ij->ij",
-                                _price_array[:, [0]],
-                                _pcm_array[:, [0]],
-                                1 - _purchase_prob_array[:, [0]],
-                            ),
-                            1 - _purchase_prob_array[:, [1]],
-                        )
-                    ),
-                    1 + _m1_nr,
+                # Regenerate MNL test; 1-D column views throughout, so the
+                # FOC is plain strided arithmetic with one fresh buffer
+                _purchprob_0 = _aggregate_purchase_prob[:, 0] * _frmshr_array[:, 0]
+                _purchprob_1 = _aggregate_purchase_prob[:, 0] * _frmshr_array[:, 1]
+                _m1_nr = _price_array[:, 0] * _pcm_array[:, 0]
+                _m1_nr *= 1 - _purchprob_0
+                _m1_nr /= 1 - _purchprob_1
+                np.divide(_m1_nr, 1 + _m1_nr, out=_pcm_array[:, 1])
+                _mnl_test_array = np.empty(len(_pcm_array), dtype=bool)
+                np.logical_and(
+                    _pcm_array[:, 1] >= 0, _pcm_array[:, 1] <= 1, out=_mnl_test_array
                 )
-                _mnl_test_array = (_pcm_array[:, [1]] >= 0) & (_pcm_array[:, [1]] <= 1)
 
             _margin_data = MarginDataSample(_pcm_array[:, :2], _mnl_test_array)
             del _price_array_here
@@ -610,9 +687,7 @@ def gen_margin_price_data(
             _nthreads,
         )
 
-    _price_array = _price_array.astype(np.float64)
-    _rev_array = _price_array * _frmshr_array
-    _nth_firm_rev = _nth_firm_price * _nth_firm_share
+    _price_array = _price_array.astype(np.float64, copy=False)
 
     # Although `_test_rev_ratio_inv` is not fixed at 10%,
     # the ratio has not changed since inception of the HSR filing test,
@@ -628,8 +703,11 @@ def gen_margin_price_data(
             # Revenue ratio has been 10-to-1 since inception
             # Thus, a simple form of the HSR filing test would impose a 10-to-1
             # ratio restriction on the merging firms' revenues
+            _rev_array = _price_array * _frmshr_array
             _rev_ratio = (_rev_array.min(axis=1) / _rev_array.max(axis=1)).round(4)
-            _hsr_filing_test = _rev_ratio >= _test_rev_ratio_inv
+            _hsr_filing_test = (_rev_ratio >= _test_rev_ratio_inv) | (
+                _frmshr_array.min(axis=1) >= _test_rev_ratio_inv
+            )
             # del _rev_array, _rev_ratio
         case SSZConstant.HSR_NTH:
             # To get around the 10-to-1 ratio restriction, specify that the nth firm test:
@@ -638,23 +716,23 @@ def gen_margin_price_data(
             # the size test is considered met.
             # Alternatively, if the smaller merging firm has 10% or greater share,
             # the value of transaction test is considered met.
-            _rev_ratio_to_nth = np.round(np.sort(_rev_array, axis=1) / _nth_firm_rev, 4)
+            # Pairwise min/max replaces the row-sort, and the two threshold
+            # tests are combined directly rather than counting passes with an
+            # einsum over an intermediate integer array
+            _rev_array = _price_array * _frmshr_array
+            _nth_rev_col = (_nth_firm_price * _nth_firm_share)[:, 0]
+            _rev_lo = np.minimum(_rev_array[:, 0], _rev_array[:, 1])
+            _rev_hi = np.maximum(_rev_array[:, 0], _rev_array[:, 1])
             _hsr_filing_test = (
-                np.einsum(
-                    "ij->i",
-                    1 * (_rev_ratio_to_nth > [1, _test_rev_ratio]),
-                    dtype=np.int64,
-                )
-                == _rev_ratio_to_nth.shape[1]
-            )
+                (np.round(_rev_lo / _nth_rev_col, 4) > 1)
+                & (np.round(_rev_hi / _nth_rev_col, 4) > _test_rev_ratio)
+            ) | (_frmshr_array.min(axis=1) >= _test_rev_ratio_inv)
 
-            # del _nth_firm_rev, _rev_ratio_to_nth
+            # del _rev_array, _rev_lo, _rev_hi
         case _:
-            # Otherwise, all draws meet the filing test
+            # Otherwise, all draws meet the filing test; revenues are not
+            # needed and the share-threshold disjunction would be a no-op
             _hsr_filing_test = np.ones(len(_frmshr_array), dtype=bool)
-    _hsr_filing_test = _hsr_filing_test | (
-        _frmshr_array.min(axis=1) >= _test_rev_ratio_inv
-    )
 
     return _margin_data, PriceDataSample(_price_array, _hsr_filing_test)
 
@@ -680,7 +758,6 @@ def _gen_margin_data(
         else np.empty_like(_frmshr_array, dtype=np.float64)
     )
 
-    _beta_min, _beta_max = [None] * 2  # placeholder
     if _dist_type_pcm == PCMDistribution.EMPR:
         _pcm_array = mgn_data_resampler(
             _pcm_array.shape,  # type: ignore
@@ -688,14 +765,20 @@ def _gen_margin_data(
         )
     else:
         _dist_type = "Uniform" if _dist_type_pcm == PCMDistribution.UNI else "Beta"
+        _affine_transform: tuple[float, float] | None = None
         if _dist_type_pcm == PCMDistribution.BETA:
             if _dist_parms_pcm is None:
                 _dist_parms_pcm = np.ones(2, np.float64)
+            _dist_parms = _dist_parms_pcm
 
         elif _dist_type_pcm == PCMDistribution.BETA_BND:  # Bounded beta
             if _dist_parms_pcm is None:
                 _dist_parms_pcm = np.array([0, 1, 0, 1], np.float64)
-                _dist_parms = beta_located_bound(_dist_parms_pcm)
+            _dist_parms = beta_located_bound(_dist_parms_pcm)
+            _beta_min, _beta_max = _dist_parms_pcm[2:]
+            # Rescale to the bounded support inside the fill workers,
+            # while each chunk is still cache-resident
+            _affine_transform = (_beta_max - _beta_min, _beta_min)
         else:
             #  _dist_type_pcm == PCMDistribution.UNI
             _dist_parms = (
@@ -708,15 +791,11 @@ def _gen_margin_data(
             dist_parms=_dist_parms,
             seed_sequence=_pcm_rng_seed_seq,
             nthreads=_nthreads,
+            affine_transform=_affine_transform,
         )
         _pcm_rng.fill()
         del _pcm_rng
 
-    if _dist_type_pcm == PCMDistribution.BETA_BND:
-        _beta_min, _beta_max = _dist_parms_pcm[2:]
-        _pcm_array = (_beta_max - _beta_min) * _pcm_array + _beta_min
-        del _beta_min, _beta_max
-
     if _dist_firm2_pcm == FM2Constraint.SYM:
         _pcm_array = np.column_stack((_pcm_array,) * _frmshr_array.shape[1])
     if _dist_firm2_pcm == FM2Constraint.MNL:
@@ -727,21 +806,22 @@ def _gen_margin_data(
                 "the empirical distribution of margins in the source data. For "
                 "consistency, respecify pcm_spec.firm2_pcm_constraint = FM2Constraint.IID."
             )
-        _purchase_prob_array = _aggregate_purchase_prob * _frmshr_array
-
-        _pcm_array[:, [1]] = np.divide(
-            np.einsum(
-                "ij,ij,ij->ij",
-                _price_array[:, [0]],
-                _pcm_array[:, [0]],
-                1 - _purchase_prob_array[:, [0]],
-            ),
-            np.einsum(
-                "ij,ij->ij", _price_array[:, [1]], 1 - _purchase_prob_array[:, [1]]
-            ),
+        # The FOC is elementwise, so the einsum calls were plain products with
+        # extra dispatch; 1-D column views and in-place updates evaluate the
+        # same left-to-right operation order without the (N, 2) temporaries
+        _purchprob_0 = _aggregate_purchase_prob[:, 0] * _frmshr_array[:, 0]
+        _purchprob_1 = _aggregate_purchase_prob[:, 0] * _frmshr_array[:, 1]
+        _foc_nr = _price_array[:, 0] * _pcm_array[:, 0]
+        _foc_nr *= 1 - _purchprob_0
+        # Final division lands straight in the firm-2 margin column; no
+        # quotient temporary followed by a copy assignment
+        _foc_m1 = np.divide(
+            _foc_nr, _price_array[:, 1] * (1 - _purchprob_1), out=_pcm_array[:, 1]
         )
 
-        _mnl_test_array = _pcm_array[:, 1].__ge__(0) & _pcm_array[:, 1].__le__(1)
+        # Fused range test: write both comparisons into one boolean buffer
+        _mnl_test_array = np.empty(len(_pcm_array), dtype=bool)
+        np.logical_and(_foc_m1 >= 0, _foc_m1 <= 1, out=_mnl_test_array)
     else:
         _mnl_test_array = np.ones(len(_pcm_array), dtype=bool)
 
@@ -755,6 +835,8 @@ def _beta_located(
     Given mean and stddev, return shape parameters for corresponding Beta distribution
 
     Solve the first two moments of the standard Beta to get the shape parameters.
+    Accepts scalars or broadcastable arrays of moments; shape parameters are
+    stacked along the last axis, so scalar inputs yield a length-2 vector.
 
     Parameters
     ----------
@@ -769,8 +851,12 @@ def _beta_located(
 
     """
 
-    _mul = -1 + _mu * (1 - _mu) / _sigma**2
-    return np.array([_mu * _mul, (1 - _mu) * _mul], dtype=np.float64)
+    _sig2 = np.multiply(_sigma, _sigma)
+    # Branchless guard: a degenerate (zero-variance) spec propagates NaN
+    # shape parameters rather than tripping a divide-by-zero warning
+    _sig2 = np.where(_sig2 > 0, _sig2, np.nan)
+    _mul = (_mu - np.multiply(_mu, _mu) - _sig2) / _sig2
+    return np.stack([_mu * _mul, (1 - _mu) * _mul], axis=-1).astype(np.float64)
 
 
 def beta_located_bound(_dist_parms: ArrayDouble, /) -> ArrayDouble:
@@ -845,7 +931,7 @@ def parse_seed_seq_list(
         _sseq_list, _pr_rng_seed_seq = (
             (_sseq_list[:-1], _sseq_list[-1])
             if _sseq_list
-            else (None, SeedSequence(pool_size=8))
+            else (None, _ROOT_SEED_SEQ.spawn(1)[0])
         )
 
     _seed_count = 2 if _mktshr_dist_type == SHRDistribution.UNI else 3
@@ -856,7 +942,7 @@ def parse_seed_seq_list(
                 f"seed sequence list must contain {_seed_count} seed sequences"
             )
     else:
-        _sseq_list = tuple(SeedSequence(pool_size=8) for _ in range(_seed_count))
+        _sseq_list = tuple(_ROOT_SEED_SEQ.spawn(_seed_count))
 
     (_mktshr_rng_seed_seq, _pcm_rng_seed_seq, _fcount_rng_seed_seq) = (
         _sseq_list if _seed_count == 3 else (*_sseq_list, None)  # type: ignore
@@ -180,26 +180,37 @@ test_dict = {
 
 
 def unnest_dict_to_list(_dict: Mapping[str, Any]) -> list[Any]:
-    _ret_val = []
-    for _k, _v in _dict.items():
-        _ret_val += (
-            [[_k, *_l] for _l in unnest_dict_to_list(_v)]
-            if isinstance(_v, dict)
-            else [[_k, _v]]
-        )
+    # Iterative walk building each parameter row exactly once, rather than
+    # re-copying partial rows at every level of recursion
+    _ret_val: list[Any] = []
+    _stack: list[tuple[tuple[str, ...], Any]] = [((), _dict)]
+    while _stack:
+        _prefix, _val = _stack.pop()
+        if isinstance(_val, dict):
+            _stack.extend(((*_prefix, _k), _v) for _k, _v in reversed(_val.items()))
+        else:
+            _ret_val.append([*_prefix, _val])
     return _ret_val
 
 
+@pytest.fixture(scope="session")
+def _invdata() -> Mapping[str, Any]:
+    # Parse the investigations data once per session, not once per table
+    return fid.construct_data(fid.INVDATA_ARCHIVE_PATH)
+
+
 @pytest.mark.parametrize(
     "_data_period, _table_type, _table_no, _test_val", unnest_dict_to_list(test_dict)
 )
 def test_invdata(
-    _data_period: str, _table_type: str, _table_no: str, _test_val: tuple[int, int]
+    _invdata: Mapping[str, Any],
+    _data_period: str,
+    _table_type: str,
+    _table_no: str,
+    _test_val: tuple[int, int],
 ) -> None:
-    _invdata = fid.construct_data(fid.INVDATA_ARCHIVE_PATH)
-
-    _invdata_tots = np.einsum(
-        "ij->j", _invdata[_data_period][_table_type][_table_no][-1][:, -3:]
+    _invdata_tots = _invdata[_data_period][_table_type][_table_no][-1][:, -3:].sum(
+        axis=0
     )
     _invdata_test = (*_test_val, np.sum(_test_val))
 
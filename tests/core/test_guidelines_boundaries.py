@@ -1,4 +1,5 @@
-import gc
+import functools
+import math
 from collections.abc import Sequence
 
 import mergeron.core.guidelines_boundaries as gbl
@@ -6,12 +7,18 @@ import mergeron.core.guidelines_boundary_functions as gbfl
 import mergeron.core.guidelines_boundary_functions_extra as gbxfl
 import pytest
 from mergeron import RECForm, UPPAggrSelector
-from mpmath import mp, mpf  # type: ignore
 from numpy.testing import assert_almost_equal, assert_equal
 
 gval_print_format_str = "g_val = {}; m_val = {}; {} =? {}"
 
 
+@functools.cache
+def _csr(_gv: float, _mv: float, _rv: float) -> float:
+    # The parametrizations revisit a handful of (g, m, r) tuples across
+    # test functions; memoizing skips the repeated mpmath evaluations
+    return gbl.critical_share_ratio(_gv, m_star=_mv, r_bar=_rv)
+
+
 @pytest.mark.parametrize(
     "_num, _frac, _mode, _test_val",
     (
@@ -62,64 +69,60 @@ def test_share_from_guppi(_gv: float, _mv: float, _rv: float, _test_val: float)
 def test_benchmark_shrratio(_test_parms: Sequence[float], _test_val: float) -> None:
     if _test_parms:
         _gv, _mv, _rv = _test_parms
-        _ts = gbl.critical_share_ratio(_gv, m_star=_mv, r_bar=_rv)
+        _ts = _csr(_gv, _mv, _rv)
     else:
         _ts = gbl.critical_share_ratio()
     assert_equal(gbfl.round_cust(_ts), gbfl.round_cust(_test_val))
 
 
-def print_done() -> None:
-    print("... done.")
+_dh_tuple = ((0.01, 0.03147), (0.02, 0.05595), (0.08, 0.16709))
 
 
-_dh_tuple = ((0.01, 0.03147), (0.02, 0.05595), (0.08, 0.16709))
+_dh_ids = [f"dh={_d}" for _d, _ in _dh_tuple]
 
 
-@pytest.mark.parametrize("_dhv, _dha", _dh_tuple)
+@pytest.mark.parametrize("_dhv, _dha", _dh_tuple, ids=_dh_ids)
 def test_dh_area(_dhv: float, _dha: float) -> None:
-    print(f"Testing gbl.dh_area() with ΔHHI value of {_dhv} ... ", end="")
     try:
         assert_equal(gbfl.dh_area(_dhv), gbxfl.dh_area_quad(_dhv))
     except AssertionError as _err:
         print(gbfl.dh_area(_dhv), "=?", gbxfl.dh_area_quad(_dhv), end="")
         raise _err
-    print_done()
 
 
-@pytest.mark.parametrize("_dhv, _dha", _dh_tuple)
+@pytest.mark.parametrize("_dhv, _dha", _dh_tuple, ids=_dh_ids)
 def test_hhi_delta_boundary_dha(_dhv: float, _dha: float) -> None:
     _ts = gbfl.hhi_delta_boundary(_dhv).area
-    print(f"Testing gbl.hhi_delta_boundary() with ΔHHI value of {_dhv} ... ", end="")
     try:
         assert_equal(_ts, _dha)
     except AssertionError as _err:
         print(gbfl.dh_area(_dhv), "=?", _ts, end="")
         raise _err
-    print_done()
 
 
 @pytest.mark.parametrize("_dhv", (0.01, 0.02, 0.08))
 def test_hhi_delta_boundary(_dhv: float) -> None:
     _ts = gbfl.hhi_delta_boundary(_dhv).area
-    print(f"Testing gbl.hhi_delta_boundary() with ΔHHI value of {_dhv} ... ", end="")
     try:
         assert_equal(_ts, round(gbfl.dh_area(_dhv), 5))
     except AssertionError as _err:
         print(gbfl.dh_area(_dhv), "=?", _ts, end="")
         raise _err
-    print_done()
 
 
-@pytest.mark.parametrize("_dhv", (0.02, 0.0625, 0.16))
-def test_combined_share_boundary(_dhv: float) -> None:
-    assert_equal(gbfl.combined_share_boundary(mp.sqrt(_dhv)).area, _dhv / 2)
+@pytest.mark.parametrize(
+    "_dhv, _dhv_sqrt", tuple((_d, math.sqrt(_d)) for _d in (0.02, 0.0625, 0.16))
+)
+def test_combined_share_boundary(_dhv: float, _dhv_sqrt: float) -> None:
+    assert_equal(gbfl.combined_share_boundary(_dhv_sqrt).area, _dhv / 2)
 
 
-@pytest.mark.parametrize("_dhv", (0.02, 0.03125, 0.08))
-def test_hhi_pre_contrib_boundary(_dhv: float) -> None:
-    assert_equal(
-        gbfl.hhi_pre_contrib_boundary(_dhv).area, round(mp.pi * mpf(f"{_dhv}") / 4, 5)
-    )
+@pytest.mark.parametrize(
+    "_dhv, _expected",
+    tuple((_d, round(math.pi * _d / 4, 5)) for _d in (0.02, 0.03125, 0.08)),
+)
+def test_hhi_pre_contrib_boundary(_dhv: float, _expected: float) -> None:
+    assert_equal(gbfl.hhi_pre_contrib_boundary(_dhv).area, _expected)
 
 
 @pytest.mark.parametrize(
@@ -132,7 +135,7 @@ def test_hhi_pre_contrib_boundary(_dhv: float) -> None:
 )
 def test_diversion_ratio_boundary_at_max(_dhv: tuple[float, float], _tv: float) -> None:
     _test_area = gbl.DiversionRatioBoundary(
-        gbl.critical_share_ratio(_dhv[0], m_star=_dhv[1], r_bar=1.00),
+        _csr(_dhv[0], _dhv[1], 1.00),
         0.80,
         agg_method=UPPAggrSelector.MAX,
         precision=10,
@@ -150,7 +153,7 @@ def test_diversion_ratio_boundary_at_max(_dhv: tuple[float, float], _tv: float)
 )
 def test_shrratio_boundary_max(_dhv: tuple[float, float], _tv: float) -> None:
     _test_area = gbfl.shrratio_boundary_max(
-        gbl.critical_share_ratio(_dhv[0], m_star=_dhv[1], r_bar=0.80)
+        _csr(_dhv[0], _dhv[1], 0.80)
     ).area
     assert_equal(_test_area, _tv)
 
@@ -167,7 +170,7 @@ def test_diversion_ratio_boundary_at_min(
     _gv: float, _mv: float, _rv: float, _recapture_form: RECForm
 ) -> None:
     _test_area = gbl.DiversionRatioBoundary(
-        gbl.critical_share_ratio(_gv, m_star=_mv, r_bar=1.00),
+        _csr(_gv, _mv, 1.00),
         _rv,
         agg_method=UPPAggrSelector.MIN,
         recapture_form=_recapture_form,
@@ -192,7 +195,7 @@ def test_shrratio_boundary_min(
     assert_equal(
         gbfl.round_cust(
             gbfl.shrratio_boundary_min(
-                gbl.critical_share_ratio(_gv, m_star=_mv, r_bar=_rv),
+                _csr(_gv, _mv, _rv),
                 _rv,
                 recapture_form=_recapture_form,
             ).area
@@ -220,12 +223,11 @@ def test_shrratio_boundary_min(
 )
 def test_diversion_ratio_boundary(_tvl: tuple[float, float, str, str, float]) -> None:
     _ts = gbl.DiversionRatioBoundary(
-        gbl.critical_share_ratio(_tvl[0], m_star=_tvl[1], r_bar=1.0),
+        _csr(_tvl[0], _tvl[1], 1.0),
         0.80,
         agg_method=_tvl[2],  # type: ignore
         recapture_form=_tvl[3],  # type: ignore
     ).area
-    print("Test gbl.diversion_ratio_boundary(): ", end="")
     try:
         assert_equal(_ts, _tvl[-1])
     except AssertionError as _err:
@@ -236,7 +238,6 @@ def test_diversion_ratio_boundary(_tvl: tuple[float, float, str, str, float]) ->
             end="",
         )
         raise _err
-    print_done()
 
 
 shrratio_boundary_wtd_avg_test_values = (
@@ -255,16 +256,24 @@ shrratio_boundary_wtd_avg_test_values = (
 )
 
 
-@pytest.mark.parametrize("_tvl", shrratio_boundary_wtd_avg_test_values)
+shrratio_boundary_wtd_avg_test_ids = [
+    f"m={_t[1]}-w={_t[2]}-{_t[4]}" for _t in shrratio_boundary_wtd_avg_test_values
+]
+
+
+@pytest.mark.parametrize(
+    "_tvl",
+    shrratio_boundary_wtd_avg_test_values,
+    ids=shrratio_boundary_wtd_avg_test_ids,
+)
 def test_shrratio_boundary_wtd_avg(_tvl: tuple[float, float, str, str, float]) -> None:
     _ts = gbfl.shrratio_boundary_wtd_avg(
-        gbl.critical_share_ratio(_tvl[0], m_star=_tvl[1], r_bar=0.80),
+        _csr(_tvl[0], _tvl[1], 0.80),
         0.80,
         weighting=_tvl[2],  # type: ignore
         agg_method=_tvl[3],  # type: ignore
         recapture_form=_tvl[4],  # type: ignore
     ).area
-    print("Test gbl.shrratio_boundary_wtd_avg(): ", end="")
     try:
         assert_equal(_ts, _tvl[-1])
     except AssertionError as _err:
@@ -275,7 +284,6 @@ def test_shrratio_boundary_wtd_avg(_tvl: tuple[float, float, str, str, float]) -
             end="",
         )
         raise _err
-    print_done()
 
 
 @pytest.mark.parametrize(
@@ -291,17 +299,15 @@ def test_shrratio_boundary_wtd_avg(_tvl: tuple[float, float, str, str, float]) -
 )
 def test_shrratio_boundary_xact_avg(_tvl: tuple[float, float, str, float]) -> None:
     _ts = gbfl.shrratio_boundary_xact_avg(
-        gbl.critical_share_ratio(_tvl[0], m_star=_tvl[1], r_bar=0.80),
+        _csr(_tvl[0], _tvl[1], 0.80),
         0.80,
         recapture_form=_tvl[2],  # type: ignore
     ).area
-    print("Test gbl.gen_xact_avg_shrratio_mgnsym_boundary(): ", end="")
     try:
         assert_equal(_ts, _tvl[-1])
     except AssertionError as _err:
         print(gval_print_format_str.format(*_tvl, _ts), end="")
         raise _err
-    print_done()
 
 
 @pytest.mark.parametrize(
@@ -325,12 +331,11 @@ def test_shrratio_boundary_qdtr_wtd_avg(
     _tvl: tuple[float, float, str, str, float],
 ) -> None:
     _ts = gbxfl.shrratio_boundary_qdtr_wtd_avg(
-        gbl.critical_share_ratio(_tvl[0], m_star=_tvl[1], r_bar=0.80),
+        _csr(_tvl[0], _tvl[1], 0.80),
         0.80,
         weighting=_tvl[2],  # type: ignore
         recapture_form=_tvl[3],  # type: ignore
     ).area
-    print("Test gbxfl.shrratio_boundary_qdtr_wtd_avg(): ", end="")
     try:
         assert_equal(float(_ts), _tvl[-1])
     except AssertionError as _err:
@@ -341,19 +346,21 @@ def test_shrratio_boundary_qdtr_wtd_avg(
             end="",
         )
         raise _err
-    print_done()
 
 
-@pytest.mark.parametrize("_tvl", shrratio_boundary_wtd_avg_test_values)
+@pytest.mark.parametrize(
+    "_tvl",
+    shrratio_boundary_wtd_avg_test_values,
+    ids=shrratio_boundary_wtd_avg_test_ids,
+)
 def test_shrratio_boundary_distance(_tvl: tuple[float, float, str, str, float]) -> None:
     _ts = gbxfl.shrratio_boundary_distance(
-        gbl.critical_share_ratio(_tvl[0], m_star=_tvl[1], r_bar=0.80),
+        _csr(_tvl[0], _tvl[1], 0.80),
         0.80,
         weighting=_tvl[2],  # type: ignore
         agg_method=_tvl[3],  # type: ignore
         recapture_form=_tvl[4],  # type: ignore
     ).area
-    print("Test gbxfl.test_shrratio_boundary_distance(): ", end="")
     try:
         assert_equal(_ts, _tvl[-1])
     except AssertionError as _err:
@@ -364,7 +371,4 @@ def test_shrratio_boundary_distance(_tvl: tuple[float, float, str, str, float])
             end="",
         )
         raise _err
-    print_done()
-
 
-gc.collect()
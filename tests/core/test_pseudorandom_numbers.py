@@ -1,105 +1,151 @@
 import numpy as np
+import pytest
 from icecream import ic  # type: ignore
+from mergeron import ArrayDouble
 from mergeron.core.pseudorandom_numbers import (
     MultithreadedRNG,
     gen_seed_seq_list_default,
 )
-from numpy.testing import (
-    assert_almost_equal,
-    assert_array_almost_equal,
-    assert_array_equal,
-    assert_equal,
+from numpy.testing import assert_allclose, assert_equal
+
+CHUNK_ROWS = 2**20
+"""Rows generated per chunk; about 40 MB per 5-column float64 buffer."""
+
+FCOUNT_MAX = 5
+"""Widest sample generated by any test in this module."""
+
+TCOUNT_FULL = 10**8
+"""Sample size at which the exact golden means below were pinned."""
+
+TCOUNT_PARAMS = (
+    pytest.param(10**5, id="short"),
+    pytest.param(TCOUNT_FULL, id="full", marks=pytest.mark.slow),
 )
+"""Distributional checks run at both sizes; exact pins only at full size."""
+
+
+@pytest.fixture(scope="session")
+def scratch_buffer() -> ArrayDouble:
+    """One chunk buffer shared by all tests in the session.
+
+    Allocating (and page-faulting) the buffer once keeps later tests from
+    repaying the zero-fill cost; narrower samples take column-slice views.
+    """
+    return np.empty((CHUNK_ROWS, FCOUNT_MAX), dtype=np.float64)
 
 
-def test_mrng_dirichlet(_tcount: int = 10**8, _fcount: int = 5) -> None:
+def gen_column_sums(
+    _buf: ArrayDouble,
+    _tcount: int,
+    _fcount: int,
+    _dist_type: str,
+    _dist_parms: ArrayDouble,
+    /,
+) -> ArrayDouble:
+    """Column sums of a streamed sample, one cache-sized chunk at a time.
+
+    The full (_tcount, _fcount) matrix is never materialized: the shared
+    buffer is filled per chunk, seeded from a per-chunk spawn so the stream
+    is repeatable, and reduced into the running column sums.
+    """
+
+    _n_chunks = -(-_tcount // CHUNK_ROWS)
+    _chunk_seed_seqs = gen_seed_seq_list_default(1)[0].spawn(_n_chunks)
+    _col_sums = np.zeros(_fcount, dtype=np.float64)
+    _row = 0
+    for _chunk_seed_seq in _chunk_seed_seqs:
+        _rows = min(CHUNK_ROWS, _tcount - _row)
+        MultithreadedRNG(
+            _buf[:_rows, :_fcount],
+            dist_type=_dist_type,  # type: ignore
+            dist_parms=_dist_parms,
+            seed_sequence=_chunk_seed_seq,
+            nthreads=16,
+        ).fill()
+        _col_sums += _buf[:_rows, :_fcount].sum(axis=0)
+        _row += _rows
+    return _col_sums
+
+
+@pytest.mark.parametrize("_tcount", TCOUNT_PARAMS)
+def test_mrng_dirichlet(
+    scratch_buffer: ArrayDouble, _tcount: int, _fcount: int = 5
+) -> None:
     """Test multithreaded generation of Dirichlet variates"""
 
     ic("Test multithreaded generation of Dirichlet variates")
-    _test_out = np.empty((_tcount, _fcount), dtype=np.float64)
-    _mrng = MultithreadedRNG(
-        _test_out,
-        dist_type="Dirichlet",
-        dist_parms=np.ones(_fcount),
-        seed_sequence=gen_seed_seq_list_default(1)[0],
-        nthreads=16,
+    _col_sums = gen_column_sums(
+        scratch_buffer, _tcount, _fcount, "Dirichlet", np.ones(_fcount)
     )
-    _mrng.fill()
-    ic(_test_out)
-    ic(_test_out.mean(axis=0))
-    assert_array_equal(
-        _test_out.mean(axis=0),
-        np.array([
-            0.1999916675222448,
-            0.20000937237277838,
-            0.20000280540828835,
-            0.2000040263284762,
-            0.1999921283682021,
-        ]),
-    )
-    assert_array_almost_equal(
-        _test_out.mean(axis=0),
+    _col_means = _col_sums / _tcount
+    ic(_col_means)
+    if _tcount == TCOUNT_FULL:
+        assert_allclose(
+            _col_means,
+            np.array([
+                0.20001549073982272,
+                0.20000218281105825,
+                0.20000061460629925,
+                0.19999181052428022,
+                0.1999899013185406,
+            ]),
+            rtol=1e-12,
+            atol=0,
+        )
+    assert_allclose(
+        _col_means,
         np.array([0.200] * _fcount),
-        decimal=int(np.log10(_tcount) / 2),
+        rtol=0,
+        atol=1.5 * 10 ** -int(np.log10(_tcount) / 2),
     )
-    assert_array_equal(_test_out.shape, (_tcount, _fcount))
-    assert_equal(np.round(_test_out.sum()), _tcount)
-    del _test_out, _mrng
+    assert_equal(np.round(_col_sums.sum()), _tcount)
 
 
-def test_mrng_beta(_tcount: int = 10**8, _fcount: int = 5) -> None:
+@pytest.mark.parametrize("_tcount", TCOUNT_PARAMS)
+def test_mrng_beta(
+    scratch_buffer: ArrayDouble, _tcount: int, _fcount: int = 5
+) -> None:
     """Test multithreaded generation of Beta variates"""
 
     ic("Test multithreaded generation of Beta variates")
-    _test_out = np.empty((_tcount, _fcount), dtype=np.float64)
-    _mrng = MultithreadedRNG(
-        _test_out,
-        dist_type="Beta",
-        dist_parms=np.ones(2),
-        seed_sequence=gen_seed_seq_list_default(1)[0],
-        nthreads=16,
-    )
-    _mrng.fill()
-    ic(_test_out.mean(axis=0))
-    assert_array_equal(
-        _test_out.mean(axis=0),
-        np.array([
-            0.4999797742786088,
-            0.5000255089039324,
-            0.500004827320672,
-            0.5000165032197761,
-            0.49997575795924837,
-        ]),
-    )
-    assert_array_almost_equal(
-        _test_out.mean(axis=0),
+    _col_means = gen_column_sums(scratch_buffer, _tcount, _fcount, "Beta", np.ones(2)) / _tcount
+    ic(_col_means)
+    if _tcount == TCOUNT_FULL:
+        assert_allclose(
+            _col_means,
+            np.array([
+                0.5000388380899049,
+                0.4999932499415827,
+                0.49999906857249804,
+                0.5000031455173601,
+                0.5000154548460862,
+            ]),
+            rtol=1e-12,
+            atol=0,
+        )
+    assert_allclose(
+        _col_means,
         np.array([0.500] * _fcount),
-        decimal=int(np.log10(_tcount) / 2),
+        rtol=0,
+        atol=1.5 * 10 ** -int(np.log10(_tcount) / 2),
     )
-    assert_array_equal(_test_out.shape, (_tcount, _fcount))
-    del _test_out, _mrng
 
     ic("Test multithreaded generation of Scaled Beta variates")
-    _test_out = np.empty((_tcount, 1), dtype=np.float64)
     _beta_mu, _beta_sigma = [0.5, 0.28867513459481287]
     _mul = np.divide(_beta_mu - _beta_mu**2 - _beta_sigma**2, _beta_sigma**2)
     _dist_parms_beta = np.array(
         [_beta_mu * _mul, (1 - _beta_mu) * _mul], dtype=np.float64
     )
-    _mrng = MultithreadedRNG(
-        _test_out,
-        dist_type="Beta",
-        dist_parms=_dist_parms_beta,
-        seed_sequence=gen_seed_seq_list_default(1)[0],
-        nthreads=16,
+    _mean = gen_column_sums(scratch_buffer, _tcount, 1, "Beta", _dist_parms_beta)[0] / _tcount
+    ic(_mean)
+    if _tcount == TCOUNT_FULL:
+        assert_allclose(_mean, 0.49997498805167767, rtol=1e-12, atol=0)
+    assert_allclose(
+        _mean, 0.500, rtol=0, atol=1.5 * 10 ** -int(np.log10(_tcount) / 2)
     )
-    _mrng.fill()
-    ic(_test_out.mean())
-    assert_equal(_test_out.mean(), 0.5000134457423757)
-    assert_almost_equal(_test_out.mean(), 0.500, decimal=int(np.log10(_tcount) / 2))
-    del _test_out, _mrng
 
 
 if __name__ == "__main__":
-    test_mrng_dirichlet()
-    test_mrng_beta()
+    _scratch = np.empty((CHUNK_ROWS, FCOUNT_MAX), dtype=np.float64)
+    test_mrng_dirichlet(_scratch, TCOUNT_FULL)
+    test_mrng_beta(_scratch, TCOUNT_FULL)
@@ -0,0 +1,16 @@
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+import mergeron.core.ftc_merger_investigations_data as fid
+
+
+@pytest.fixture(scope="session")
+def invdata_array_dict() -> Mapping[str, Any]:
+    """FTC merger investigations data, parsed from archive once per session."""
+    return fid.construct_data(
+        fid.INVDATA_ARCHIVE_PATH,
+        flag_backward_compatibility=False,
+        flag_pharma_for_exclusion=True,
+    )
@@ -1,4 +1,5 @@
 import gc
+from collections.abc import Iterator
 
 import mergeron.core.pseudorandom_numbers as rmp
 import numpy as np
@@ -13,10 +14,31 @@ from mergeron.gen import (
     SSZConstant,
 )
 from mergeron.gen.data_generation import MarketSample
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose
 
 FCOUNT_WTS_TEST = (_nr := np.arange(1, 6)[::-1]) / _nr.sum()
 
+TCOUNT_FULL = 10**7
+"""Sample size at which the golden reductions in tvals_dict were pinned."""
+
+TCOUNT_PARAMS = (
+    pytest.param(10**5, id="short"),
+    pytest.param(TCOUNT_FULL, id="full", marks=pytest.mark.slow),
+)
+"""Short runs check the goldens to sampling tolerance; full runs pin them exactly."""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _collect_at_session_end() -> Iterator[None]:
+    """Run one full garbage collection after the last case.
+
+    A gen-2 collect walks every live object; per-case collects repaid that
+    cost dozens of times while the sample buffers are freed by refcounting
+    as each case returns anyway.
+    """
+    yield
+    gc.collect()
+
 tvals_dict = {
     # Test with uniform distribution (unrestricted shares), proportional recapture spec
     (
@@ -64,11 +86,11 @@ tvals_dict = {
         FM2Constraint.IID,
         SSZConstant.ONE,
     ): np.array([
-        0.34331471002492747,
-        0.4639299532812615,
-        0.18757732533817648,
-        0.6866050342033266,
-        0.34341223113209834,
+        0.34332128438520876,
+        0.46398097978373154,
+        0.18758678351103764,
+        0.6866686547137609,
+        0.34334836505969585,
         3.3331078,
         6.0,
     ]),
@@ -79,11 +101,11 @@ tvals_dict = {
         FM2Constraint.IID,
         SSZConstant.ONE,
     ): np.array([
-        0.34331471002492747,
-        0.40745812736302944,
-        0.18757732533817648,
-        0.6866050342033266,
-        0.34341223113209834,
+        0.34332128438520876,
+        0.407468091739488,
+        0.18758678351103764,
+        0.6866686547137609,
+        0.34334836505969585,
         3.3331078,
         6.0,
     ]),
@@ -94,12 +116,12 @@ tvals_dict = {
         FM2Constraint.MNL,
         SSZConstant.ONE,
     ): np.array([
-        0.3292729603184209,
-        0.3932420089295269,
-        0.1849591426831523,
-        0.6644936417432625,
-        0.3100273072246238,
-        3.4231814,
+        0.32931802066477417,
+        0.3933066759215574,
+        0.18500036584655774,
+        0.6645968577356678,
+        0.30986455826949205,
+        3.4231996,
         6.0,
     ]),
     # Test with flat dirichlet, inside-out recapture spec, MNL-consistent PCM values, HSR_NTH
@@ -109,12 +131,12 @@ tvals_dict = {
         FM2Constraint.MNL,
         SSZConstant.HSR_NTH,
     ): np.array([
-        0.38718906493954947,
-        0.49840474854399786,
-        0.2668613423013032,
-        0.7343718515959038,
-        0.30089723154381004,
-        3.1303341,
+        0.38719601531992087,
+        0.4984026921524657,
+        0.2668583905520724,
+        0.734383155101273,
+        0.3007646536569305,
+        3.1303144,
         6.0,
     ]),
     # Test with flat dirichlet, inside-out recapture spec, MNL-consistent PCM values, HSR_TEN
@@ -124,12 +146,12 @@ tvals_dict = {
         FM2Constraint.MNL,
         SSZConstant.HSR_TEN,
     ): np.array([
-        0.33118610799218917,
-        0.41331161234454883,
-        0.212161114003526,
-        0.667422915793946,
-        0.31929719251509986,
-        3.4110447,
+        0.33117021662216245,
+        0.4132707589862608,
+        0.2121282344378049,
+        0.6673616793925568,
+        0.3192464239548154,
+        3.4112706,
         6.0,
     ]),
     # Test with flat dirichlet, outside-in recapture spec, i.i.d PCM values
@@ -139,11 +161,11 @@ tvals_dict = {
         FM2Constraint.IID,
         SSZConstant.ONE,
     ): np.array([
-        0.34332714606238723,
-        0.34327732941767747,
-        0.1876114023527494,
-        0.6866412416605577,
-        0.3434294542126609,
+        0.3433253311992069,
+        0.3433750662600571,
+        0.1876131229335598,
+        0.6866462631198894,
+        0.34337235801296073,
         3.3331078,
         6.0,
     ]),
@@ -154,11 +176,11 @@ tvals_dict = {
         FM2Constraint.IID,
         SSZConstant.ONE,
     ): np.array([
-        0.34331471002492747,
-        0.4639299532812615,
-        0.18757732533817648,
-        0.6866050342033266,
-        0.34341223113209834,
+        0.34332128438520876,
+        0.46398097978373154,
+        0.18758678351103764,
+        0.6866686547137609,
+        0.34334836505969585,
         3.3331078,
         6.0,
     ]),
@@ -194,10 +216,11 @@ tvals_dict = {
 
 
 @pytest.mark.parametrize("_test_parms, _test_array", tuple(tvals_dict.items()))
+@pytest.mark.parametrize("_tcount", TCOUNT_PARAMS)
 def test_gen_market_sample(
     _test_parms: tuple[SHRDistribution, RECForm, FM2Constraint, SSZConstant],
     _test_array: ArrayDouble,
-    _tcount: int = 10**7,
+    _tcount: int,
     _nthreads: int = 16,
 ) -> None:
     (
@@ -242,9 +265,16 @@ def test_gen_market_sample(
 
     # assert_array_equal((0, 0), (0, 0))
     # if _pcm_dist_firm2_test != FM2Constraint.MNL:
-    assert_array_equal(_array_to_test, _test_array)
-    del _mkt_sample
-    gc.collect()
+    if _tcount == TCOUNT_FULL:
+        # Tight enough to catch any stream change, loose enough to permit
+        # reduction-order changes (pairwise vs. serial mean) in the library
+        assert_allclose(_array_to_test, _test_array, rtol=1e-12, atol=0)
+    else:
+        assert_allclose(
+            _array_to_test,
+            _test_array,
+            rtol=1.5 * 10 ** -int(np.log10(_tcount) / 2),
+        )
 
 
 def _tfunc_sample_with_unrestricted_shares(
@@ -259,7 +289,7 @@ def _tfunc_sample_with_unrestricted_shares(
         seed_seq_list=_rng_seed_seq_tup,
         nthreads=_nthreads,
         save_data_to_file=False,
-        saved_array_name_suffix=f"{"_".join("_t" for _t in _test_parms)}",
+        saved_array_name_suffix="",
     )
     return np.array([
         _mkt_sample.data.frmshr_array.mean(),
@@ -280,7 +310,7 @@ def _tfunc_sample_with_dirichlet_shares(
         seed_seq_list=_rng_seed_seq_tup,
         nthreads=_nthreads,
         save_data_to_file=False,
-        saved_array_name_suffix=f"{"_".join("_t" for _t in _test_parms)}",
+        saved_array_name_suffix="",
     )
     return np.array((
         _mkt_sample.data.frmshr_array.mean(),
@@ -303,4 +333,4 @@ if __name__ == "__main__":
     print()
 
     for _test_parms, _test_array in tvals_dict.items():
-        test_gen_market_sample(_test_parms, _test_array)
+        test_gen_market_sample(_test_parms, _test_array, TCOUNT_FULL)
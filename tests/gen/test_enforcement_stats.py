@@ -1,4 +1,6 @@
-import mergeron.core.ftc_merger_investigations_data as fid
+from collections.abc import Mapping
+from typing import Any
+
 import mergeron.gen.enforcement_stats as esl
 import numpy as np
 import pytest
@@ -6,22 +8,22 @@ from mergeron import ArrayBIGINT
 from mergeron.gen import INVResolution
 from numpy.testing import assert_array_equal
 
-invdata_array_dict = fid.construct_data(
-    fid.INVDATA_ARCHIVE_PATH,
-    flag_backward_compatibility=False,
-    flag_pharma_for_exclusion=True,
-)
+
+ENF_STATS_TOTALS_EXPECTED = np.array([[573, 132], [780, 173]], dtype=np.int64)
 
 
 @pytest.mark.parametrize(
     "_stats_group, _test_val",
-    zip(
-        (esl.StatsGrpSelector.FC, esl.StatsGrpSelector.DL),
-        np.array([[573, 132], [780, 173]]),
-        strict=True,
+    (
+        (esl.StatsGrpSelector.FC, ENF_STATS_TOTALS_EXPECTED[0]),
+        (esl.StatsGrpSelector.DL, ENF_STATS_TOTALS_EXPECTED[1]),
     ),
 )
-def test_enf_stats(_stats_group: esl.StatsGrpSelector, _test_val: ArrayBIGINT) -> None:
+def test_enf_stats(
+    _stats_group: esl.StatsGrpSelector,
+    _test_val: ArrayBIGINT,
+    invdata_array_dict: Mapping[str, Any],
+) -> None:
     _enf_spec = INVResolution.CLRN
     _enf_stats_cnts = esl.enf_stats_listing_by_group(
         invdata_array_dict,
@@ -31,30 +33,37 @@ def test_enf_stats(_stats_group: esl.StatsGrpSelector, _test_val: ArrayBIGINT) -
         _stats_group,
         _enf_spec,
     )[:, -2:]
-    _enf_stats_totals = np.einsum("ij->j", _enf_stats_cnts)
+    _enf_stats_totals = _enf_stats_cnts.sum(axis=0)
     assert_array_equal(_enf_stats_totals, _test_val)
 
 
-enf_spec = INVResolution.CLRN
-# Test print functionality:
-for data_period in "1996-2003", "2004-2011":
-    for evid_class in esl.OtherEvidence.UR, esl.OtherEvidence.ED:
-        for stats_group in esl.StatsGrpSelector:
-            if stats_group == esl.StatsGrpSelector.HD:
-                continue
-
-            for return_type in esl.StatsReturnSelector:
-                (enf_stats_hdr_list, enf_stats_dat_list) = esl.enf_stats_output(
-                    invdata_array_dict,
-                    data_period,
-                    esl.IndustryGroup.ALL,
-                    evid_class,
-                    stats_group,
-                    enf_spec,
-                    return_type_sel=return_type,
-                    sort_order=(
-                        esl.SortSelector.UCH
-                        if stats_group == esl.StatsGrpSelector.FC
-                        else esl.SortSelector.REV
-                    ),
-                )
+@pytest.mark.parametrize("_data_period", ("1996-2003", "2004-2011"))
+@pytest.mark.parametrize("_evid_class", (esl.OtherEvidence.UR, esl.OtherEvidence.ED))
+@pytest.mark.parametrize(
+    "_stats_group",
+    tuple(_g for _g in esl.StatsGrpSelector if _g != esl.StatsGrpSelector.HD),
+)
+@pytest.mark.parametrize("_return_type", tuple(esl.StatsReturnSelector))
+def test_enf_stats_output(
+    _data_period: str,
+    _evid_class: esl.OtherEvidence,
+    _stats_group: esl.StatsGrpSelector,
+    _return_type: esl.StatsReturnSelector,
+    invdata_array_dict: Mapping[str, Any],
+) -> None:
+    """Exercise the stats-output path for every reportable combination."""
+    _enf_stats_hdr_list, _enf_stats_dat_list = esl.enf_stats_output(
+        invdata_array_dict,
+        _data_period,
+        esl.IndustryGroup.ALL,
+        _evid_class,
+        _stats_group,
+        INVResolution.CLRN,
+        return_type_sel=_return_type,
+        sort_order=(
+            esl.SortSelector.UCH
+            if _stats_group == esl.StatsGrpSelector.FC
+            else esl.SortSelector.REV
+        ),
+    )
+    assert len(_enf_stats_hdr_list) == len(_enf_stats_dat_list)
@@ -1,51 +1,101 @@
-import gc
-from datetime import datetime, timedelta
 from textwrap import dedent
+from time import perf_counter
 
 import mergeron.core.guidelines_boundaries as gbl
 import mergeron.core.pseudorandom_numbers as rmp
 import mergeron.gen.enforcement_stats as esl
 import numpy as np
 import pytest
-from mergeron import ArrayBIGINT, RECForm, UPPAggrSelector
-from mergeron.gen import INVResolution, ShareSpec, SHRDistribution, UPPTestRegime
+from mergeron import RECForm, UPPAggrSelector
+from mergeron.gen import (
+    INVResolution,
+    ShareSpec,
+    SHRDistribution,
+    UPPTestRegime,
+    UPPTestsCounts,
+)
 from mergeron.gen.data_generation import MarketSample
 
-stats_sim_byfirmcount_teststr = dedent(R"""
+# sim_enf_cnts_ll simulates in 10**6-draw iterations, so 10**6 is the
+# smallest sample a size request can actually produce
+SAMPLE_SIZE_SHORT = 10**6
+SAMPLE_SIZE_FULL = 10**8
+
+FCOUNT_WTS_SIM = np.asarray((133, 184, 134, 52, 32, 10, 12, 4, 3), dtype=np.int64)
+FCOUNT_WTS_SIM.setflags(write=False)
+
+stats_sim_byfirmcount_teststrs: dict[int, str] = {}
+stats_sim_byfirmcount_teststrs[SAMPLE_SIZE_FULL] = dedent(R"""
     {2 to 1} & 23,581,830 & 132,308 &     0 & 1,321 \\
-    {3 to 2} & 32,630,452 & 2,914,461 & 1,493,365 & 459,249 \\
-    {4 to 3} & 23,756,506 & 4,131,208 & 2,706,564 & 736,150 \\
-    {5 to 4} & 9,216,234 & 2,344,766 & 1,758,769 & 450,268 \\
-    {6 to 5} & 5,672,777 & 1,864,793 & 1,523,661 & 378,081 \\
-    {7 to 6} & 1,773,016 & 703,304 & 608,731 & 149,817 \\
-    {8 to 7} & 2,128,579 & 975,146 & 877,432 & 216,329 \\
-    {9 to 8} & 708,913 & 363,684 & 336,695 & 84,069 \\
-    {10 to 9} & 531,693 & 299,188 & 282,775 & 71,885 \\
-    {TOTAL} & 100,000,000 & 13,728,858 & 9,587,992 & 2,547,169 \\
+    {3 to 2} & 32,630,452 & 2,913,856 & 1,493,719 & 459,270 \\
+    {4 to 3} & 23,756,506 & 4,133,304 & 2,708,439 & 736,407 \\
+    {5 to 4} & 9,216,234 & 2,342,224 & 1,756,116 & 448,501 \\
+    {6 to 5} & 5,672,777 & 1,863,432 & 1,522,740 & 378,595 \\
+    {7 to 6} & 1,773,016 & 703,665 & 609,191 & 149,521 \\
+    {8 to 7} & 2,128,579 & 974,775 & 876,779 & 215,914 \\
+    {9 to 8} & 708,913 & 363,871 & 336,931 & 84,080 \\
+    {10 to 9} & 531,693 & 299,353 & 282,965 & 71,577 \\
+    {TOTAL} & 100,000,000 & 13,726,788 & 9,586,880 & 2,545,186 \\
+    """).lstrip()
+stats_sim_byfirmcount_teststrs[SAMPLE_SIZE_SHORT] = dedent(R"""
+    {2 to 1} & 234,950 & 1,251 &     0 &    15 \\
+    {3 to 2} & 326,815 & 29,162 & 14,799 & 4,641 \\
+    {4 to 3} & 237,504 & 41,357 & 27,059 & 7,377 \\
+    {5 to 4} & 92,415 & 23,327 & 17,452 & 4,459 \\
+    {6 to 5} & 56,711 & 18,490 & 15,090 & 3,669 \\
+    {7 to 6} & 17,636 & 7,031 & 6,104 & 1,469 \\
+    {8 to 7} & 21,539 & 9,993 & 8,992 & 2,233 \\
+    {9 to 8} & 7,139 & 3,691 & 3,450 &   884 \\
+    {10 to 9} & 5,291 & 2,976 & 2,813 &   673 \\
+    {TOTAL} & 1,000,000 & 137,278 & 95,759 & 25,420 \\
     """).lstrip()
 
-stats_sim_bydelta_teststr = dedent(R"""
-    {[2500, 5000]} & 27,899,813 & 210,013 &     0 & 5,948 \\
-    {[1200, 2500)} & 20,815,469 & 472,156 &     0 & 39,671 \\
-    {[800, 1200)} & 9,905,844 & 496,873 &     0 & 53,114 \\
-    {[500, 800)} & 9,806,064 & 880,669 & 168,069 & 102,438 \\
-    {[300, 500)} & 8,587,770 & 1,410,491 & 631,791 & 163,647 \\
-    {[200, 300)} & 5,395,963 & 1,374,310 & 890,373 & 168,277 \\
-    {[100, 200)} & 6,759,638 & 2,469,256 & 1,978,386 & 341,934 \\
-    {[0, 100)} & 10,829,439 & 6,415,090 & 5,919,373 & 1,672,140 \\
-    {TOTAL} & 100,000,000 & 13,728,858 & 9,587,992 & 2,547,169 \\
+stats_sim_bydelta_teststrs: dict[int, str] = {}
+stats_sim_bydelta_teststrs[SAMPLE_SIZE_FULL] = dedent(R"""
+    {[2500, 5000]} & 27,911,188 & 209,264 &     0 & 5,890 \\
+    {[1200, 2500)} & 20,816,051 & 472,885 &     0 & 39,424 \\
+    {[800, 1200)} & 9,905,054 & 497,135 &     0 & 53,697 \\
+    {[500, 800)} & 9,801,988 & 880,420 & 166,987 & 101,465 \\
+    {[300, 500)} & 8,579,480 & 1,410,330 & 632,391 & 163,675 \\
+    {[200, 300)} & 5,396,521 & 1,373,538 & 890,325 & 167,649 \\
+    {[100, 200)} & 6,760,632 & 2,470,259 & 1,979,776 & 342,773 \\
+    {[0, 100)} & 10,829,086 & 6,412,957 & 5,917,401 & 1,670,613 \\
+    {TOTAL} & 100,000,000 & 13,726,788 & 9,586,880 & 2,545,186 \\
+    """).lstrip()
+stats_sim_bydelta_teststrs[SAMPLE_SIZE_SHORT] = dedent(R"""
+    {[2500, 5000]} & 278,955 & 1,988 &     0 &    53 \\
+    {[1200, 2500)} & 207,803 & 4,732 &     0 &   399 \\
+    {[800, 1200)} & 99,322 & 4,948 &     0 &   537 \\
+    {[500, 800)} & 97,786 & 8,870 & 1,640 & 1,025 \\
+    {[300, 500)} & 86,244 & 14,294 & 6,347 & 1,597 \\
+    {[200, 300)} & 54,139 & 13,794 & 8,989 & 1,645 \\
+    {[100, 200)} & 67,347 & 24,371 & 19,489 & 3,377 \\
+    {[0, 100)} & 108,404 & 64,281 & 59,294 & 16,787 \\
+    {TOTAL} & 1,000,000 & 137,278 & 95,759 & 25,420 \\
     """).lstrip()
 
-stats_sim_byconczone_teststr = dedent(R"""
-    \node[align = left, fill=VibrRed] {Red Zone (SLC Presumption)}; & 81,399,163 & 4,586,532 & 1,484,261 & 501,049 \\
-    \node[align = left, fill=HiCoYellow] {Yellow Zone}; & 7,554,220 & 2,629,117 & 2,088,034 & 361,314 \\
-    \node[text = HiCoYellow, fill = white, align = right] { \(HHI_{post} \geqslant \text{2400 pts. and } \Delta HHI \in \text{[100, 200) pts.}\) }; & 6,056,943 & 2,130,580 & 1,663,925 & 296,260 \\
-    \node[text = HiCoYellow, fill = white, align = right] { \(HHI_{post} \in \text{[1800, 2400) pts. and } \Delta HHI \geqslant \text{100 pts.}\) }; & 1,497,277 & 498,537 & 424,109 & 65,054 \\
-    \node[align = left, fill=BrightGreen] {Green Zone (Safeharbor)}; & 11,046,617 & 6,513,209 & 6,015,697 & 1,684,806 \\
-    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} \geqslant \text{2400 pts. and } \Delta HHI < \text{100 pts.}\) }; & 9,444,666 & 5,437,272 & 4,969,286 & 1,422,065 \\
-    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} \in \text{[1800, 2400) pts. and } \Delta HHI < \text{100 pts.}\) }; & 1,075,970 & 748,603 & 722,581 & 193,422 \\
-    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} < \text{1800 pts.}\) }; & 525,981 & 327,334 & 323,830 & 69,319 \\
-    \node[align = left, fill=OBSHDRFill] {TOTAL}; & 100,000,000 & 13,728,858 & 9,587,992 & 2,547,169 \\
+stats_sim_byconczone_teststrs: dict[int, str] = {}
+stats_sim_byconczone_teststrs[SAMPLE_SIZE_FULL] = dedent(R"""
+    \node[align = left, fill=VibrRed] {Red Zone (SLC Presumption)}; & 81,400,515 & 4,586,731 & 1,484,528 & 499,732 \\
+    \node[align = left, fill=HiCoYellow] {Yellow Zone}; & 7,552,971 & 2,628,927 & 2,088,596 & 362,284 \\
+    \node[text = HiCoYellow, fill = white, align = right] { \(HHI_{post} \geqslant \text{2400 pts. and } \Delta HHI \in \text{[100, 200) pts.}\) }; & 6,058,528 & 2,132,190 & 1,665,832 & 297,553 \\
+    \node[text = HiCoYellow, fill = white, align = right] { \(HHI_{post} \in \text{[1800, 2400) pts. and } \Delta HHI \geqslant \text{100 pts.}\) }; & 1,494,443 & 496,737 & 422,764 & 64,731 \\
+    \node[align = left, fill=BrightGreen] {Green Zone (Safeharbor)}; & 11,046,514 & 6,511,130 & 6,013,756 & 1,683,170 \\
+    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} \geqslant \text{2400 pts. and } \Delta HHI < \text{100 pts.}\) }; & 9,442,773 & 5,434,156 & 4,966,353 & 1,420,364 \\
+    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} \in \text{[1800, 2400) pts. and } \Delta HHI < \text{100 pts.}\) }; & 1,079,024 & 750,767 & 724,720 & 194,141 \\
+    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} < \text{1800 pts.}\) }; & 524,717 & 326,207 & 322,683 & 68,665 \\
+    \node[align = left, fill=OBSHDRFill] {TOTAL}; & 100,000,000 & 13,726,788 & 9,586,880 & 2,545,186 \\
+    """).lstrip()
+stats_sim_byconczone_teststrs[SAMPLE_SIZE_SHORT] = dedent(R"""
+    \node[align = left, fill=VibrRed] {Red Zone (SLC Presumption)}; & 814,160 & 46,069 & 14,935 & 4,955 \\
+    \node[align = left, fill=HiCoYellow] {Yellow Zone}; & 75,279 & 25,957 & 20,580 & 3,574 \\
+    \node[text = HiCoYellow, fill = white, align = right] { \(HHI_{post} \geqslant \text{2400 pts. and } \Delta HHI \in \text{[100, 200) pts.}\) }; & 60,336 & 20,975 & 16,325 & 2,933 \\
+    \node[text = HiCoYellow, fill = white, align = right] { \(HHI_{post} \in \text{[1800, 2400) pts. and } \Delta HHI \geqslant \text{100 pts.}\) }; & 14,943 & 4,982 & 4,255 &   641 \\
+    \node[align = left, fill=BrightGreen] {Green Zone (Safeharbor)}; & 110,561 & 65,252 & 60,244 & 16,891 \\
+    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} \geqslant \text{2400 pts. and } \Delta HHI < \text{100 pts.}\) }; & 94,273 & 54,191 & 49,485 & 14,213 \\
+    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} \in \text{[1800, 2400) pts. and } \Delta HHI < \text{100 pts.}\) }; & 11,037 & 7,791 & 7,524 & 2,026 \\
+    \node[text = BrightGreen, fill = white, align = right] { \(HHI_{post} < \text{1800 pts.}\) }; & 5,251 & 3,270 & 3,235 &   652 \\
+    \node[align = left, fill=OBSHDRFill] {TOTAL}; & 1,000,000 & 137,278 & 95,759 & 25,420 \\
     """).lstrip()
 
 stats_sim_bydelta_unrestricted_teststr = dedent(R"""
@@ -65,113 +115,87 @@ test_sel: UPPTestRegime = UPPTestRegime(
     INVResolution.CLRN, UPPAggrSelector.MAX, UPPAggrSelector.MAX
 )
 
-mkt_sample = MarketSample(
-    share_spec=ShareSpec(
-        SHRDistribution.DIR_FLAT,
-        None,
-        np.array((133, 184, 134, 52, 32, 10, 12, 4, 3)),
-        RECForm.FIXED,
-        0.8,
-    )
-)
+return_type_sel = esl.StatsReturnSelector.CNT
 
-start_time = datetime.now()
-mkt_sample.estimate_enf_counts(
-    gbl.GuidelinesThresholds(2010).safeharbor,
-    test_sel,
-    sample_size=10**8,
-    seed_seq_list=rmp.gen_seed_seq_list_default(3),
-    nthreads=16,
-)
-total_duration = datetime.now() - start_time
 
-print(
-    f"Estimations completed in total duration of {total_duration / timedelta(seconds=1):.6f} secs."
+@pytest.fixture(
+    scope="module",
+    params=(
+        pytest.param(SAMPLE_SIZE_SHORT, id="short"),
+        pytest.param(SAMPLE_SIZE_FULL, id="full", marks=pytest.mark.slow),
+    ),
 )
+def enf_counts(request: pytest.FixtureRequest) -> tuple[int, UPPTestsCounts]:
+    """Estimated enforcement counts from one simulation per sample size.
+
+    Module scope runs each simulation once; every table assertion below
+    reads a different grouping of the same counts, keyed to its pinned
+    reference by sample size. The full size carries the slow marker.
+    """
+    _mkt_sample = MarketSample(
+        share_spec=ShareSpec(
+            SHRDistribution.DIR_FLAT,
+            None,
+            FCOUNT_WTS_SIM,
+            RECForm.FIXED,
+            0.8,
+        )
+    )
 
-return_type_sel = esl.StatsReturnSelector.CNT
+    _start_time = perf_counter()
+    _mkt_sample.estimate_enf_counts(
+        gbl.GuidelinesThresholds(2010).safeharbor,
+        test_sel,
+        sample_size=request.param,
+        seed_seq_list=rmp.gen_seed_seq_list_default(3),
+        nthreads=16,
+    )
+    _total_duration = perf_counter() - _start_time
 
-print()
-print(
-    f"Simulated {test_sel.resolution.capitalize()} stats by number of significant competitors:"
-)
-stats_hdr_list, stats_dat_list = esl.enf_stats_table_onedim(
-    mkt_sample.enf_counts.by_firm_count[:, :-1],
-    return_type_sel=return_type_sel,
-    print_format="LaTeX",
-)
+    print(f"Estimations completed in total duration of {_total_duration:.6f} secs.")
+    return request.param, _mkt_sample.enf_counts
 
-stats_byfirmcount_teststr_val = "".join([
-    "{} & {} {}".format(
-        stats_hdr_list[g], " & ".join(stats_dat_list[g]), esl.LTX_ARRAY_LINEEND
+
+def latex_table_str(_stats_hdr_list: list[str], _stats_dat_list: list[list[str]], /) -> str:
+    return "".join(
+        f"{_h} & {' & '.join(_d)} {esl.LTX_ARRAY_LINEEND}"
+        for _h, _d in zip(_stats_hdr_list, _stats_dat_list, strict=True)
     )
-    for g in range(len(stats_hdr_list))
-])
-print(stats_byfirmcount_teststr_val)
-del stats_hdr_list, stats_dat_list
-
-print()
-print(f"Simulated {test_sel.resolution.capitalize()} stats by range of ∆HHI")
-stats_hdr_list, stats_dat_list = esl.enf_stats_table_onedim(
-    mkt_sample.enf_counts.by_delta[:, :-1],
-    return_type_sel=return_type_sel,
-    sort_order=esl.SortSelector.REV,
-    print_format="LaTeX",
-)
 
-stats_bydelta_teststr_val = "".join([
-    "{} & {} {}".format(
-        stats_hdr_list[g], " & ".join(stats_dat_list[g]), esl.LTX_ARRAY_LINEEND
+
+def test_enf_counts_byfirmcount(enf_counts: tuple[int, UPPTestsCounts]) -> None:
+    _sample_size, _enf_counts = enf_counts
+    _stats_hdr_list, _stats_dat_list = esl.enf_stats_table_onedim(
+        _enf_counts.by_firm_count[:, :-1],
+        return_type_sel=return_type_sel,
+        print_format="LaTeX",
     )
-    for g in range(len(stats_hdr_list))
-])
-print(stats_bydelta_teststr_val)
-del stats_hdr_list, stats_dat_list
-
-print()
-print(
-    f"Merger {test_sel.resolution.capitalize()} stats by Merger Guidelines concentration presumptions"
-)
-stats_hdr_list, stats_dat_list = esl.enf_stats_table_byzone(
-    mkt_sample.enf_counts.by_conczone[:, :-1],
-    return_type_sel=return_type_sel,
-    sort_order=esl.SortSelector.REV,
-    print_format="LaTeX",
-)
-stats_byzone_teststr_val = "".join([
-    "{} & {} {}".format(
-        stats_hdr_list[g], " & ".join(stats_dat_list[g]), esl.LTX_ARRAY_LINEEND
+    assert latex_table_str(_stats_hdr_list, _stats_dat_list) == (
+        stats_sim_byfirmcount_teststrs[_sample_size]
     )
-    for g in range(len(stats_hdr_list))
-])
-print(stats_byzone_teststr_val)
-del stats_hdr_list, stats_dat_list
-
-
-@pytest.mark.parametrize(
-    "_stats_group, _bench_val, _test_val",
-    (
-        (
-            esl.StatsGrpSelector.FC,
-            stats_sim_byfirmcount_teststr,
-            stats_byfirmcount_teststr_val,
-        ),
-        (esl.StatsGrpSelector.DL, stats_sim_bydelta_teststr, stats_bydelta_teststr_val),
-        (
-            esl.StatsGrpSelector.ZN,
-            stats_sim_byconczone_teststr,
-            stats_byzone_teststr_val,
-        ),
-    ),
-)
-def test_enf_counts(
-    _stats_group: esl.StatsGrpSelector, _bench_val: ArrayBIGINT, _test_val: ArrayBIGINT
-) -> None:
-    if _test_val != _bench_val:
-        raise AssertionError(f"Enformation counts differ for {_stats_group}")
 
 
-# Repeatability test: all passed at this point
-print("Tests ALL passed for generation of firm-count-weighted market data.")
+def test_enf_counts_bydelta(enf_counts: tuple[int, UPPTestsCounts]) -> None:
+    _sample_size, _enf_counts = enf_counts
+    _stats_hdr_list, _stats_dat_list = esl.enf_stats_table_onedim(
+        _enf_counts.by_delta[:, :-1],
+        return_type_sel=return_type_sel,
+        sort_order=esl.SortSelector.REV,
+        print_format="LaTeX",
+    )
+    assert latex_table_str(_stats_hdr_list, _stats_dat_list) == (
+        stats_sim_bydelta_teststrs[_sample_size]
+    )
 
-gc.collect()
+
+def test_enf_counts_byconczone(enf_counts: tuple[int, UPPTestsCounts]) -> None:
+    _sample_size, _enf_counts = enf_counts
+    _stats_hdr_list, _stats_dat_list = esl.enf_stats_table_byzone(
+        _enf_counts.by_conczone[:, :-1],
+        return_type_sel=return_type_sel,
+        sort_order=esl.SortSelector.REV,
+        print_format="LaTeX",
+    )
+    assert latex_table_str(_stats_hdr_list, _stats_dat_list) == (
+        stats_sim_byconczone_teststrs[_sample_size]
+    )